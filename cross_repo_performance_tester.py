@@ -8,37 +8,123 @@ then runs performance tests with detailed, emoji-rich reporting.
 import subprocess
 import sys
 import os
+import asyncio
+import importlib.util
 import io
-import requests
+import shutil
 import time
 import json
+from collections import Counter
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.live import Live
+from rich.progress import track
 from rich.layout import Layout
 from rich.text import Text
 from datetime import datetime
+from jinja2 import Environment, FileSystemLoader
 
-# Fix Windows encoding
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+try:
+    import orjson  # optional - much faster than json for the report's result blobs
+except ImportError:
+    orjson = None
+
+# Fix Windows encoding - reconfigure in place rather than stacking another wrapper
+# (replaced streams such as pytest's capture or io.StringIO have no reconfigure)
+try:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+except AttributeError:
+    pass
 
 console = Console()
 
 # Repository paths (relative to current directory)
 SCRIPT_DIR = Path(__file__).parent.absolute()
+REPORT_TEMPLATES_DIR = SCRIPT_DIR / "templates"
 WORKSPACE_ROOT = SCRIPT_DIR.parent
 AUTOMATION_REPO = WORKSPACE_ROOT / "automation-testing-playground"
 PENTESTING_REPO = WORKSPACE_ROOT / "pentesting-playground"
 RESULTS_DIR = SCRIPT_DIR / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
+TEMPLATES_DIR = RESULTS_DIR / "_templates"
+TEMPLATES_DIR.mkdir(exist_ok=True)
+LOCUSTFILE_PATH = TEMPLATES_DIR / "locustfile.py"
+K6_SCRIPT_PATH = TEMPLATES_DIR / "k6_test.js"
+
+# Fixed per run - build the docker/k6 arguments once rather than per target
+K6_VOLUME_MOUNT = f"{RESULTS_DIR}:/scripts"
+K6_CONTAINER_SCRIPT = f"/scripts/{TEMPLATES_DIR.name}/{K6_SCRIPT_PATH.name}"
+K6_CONTAINER_NAME = "cross-repo-perf-k6"
+
+# Only the end of a tool's stderr is worth keeping - that's where the error is
+STDERR_TAIL = 2048
+
+# Targets are a handful of fixed hosts, so a resolved address can be reused for the whole run
+DNS_CACHE_TTL = 3600
+
+# Shared test scripts - the target comes from --host / BASE_URL and the
+# endpoint from the environment, so one file serves every target
+LOCUSTFILE_TEMPLATE = '''
+import os
+
+from locust import FastHttpUser, task, between
+
+ENDPOINT = os.environ.get("PERF_ENDPOINT", "/")
+
+
+class QuickTestUser(FastHttpUser):
+    wait_time = between(1, 2)
+    
+    @task
+    def test_endpoint(self):
+        self.client.get(ENDPOINT, name=ENDPOINT)
+'''
+
+K6_SCRIPT_TEMPLATE = '''
+import http from 'k6/http';
+import { check, sleep } from 'k6';
+
+export const options = {
+  stages: [
+    { duration: '10s', target: 5 },
+    { duration: '20s', target: 5 },
+    { duration: '10s', target: 0 },
+  ],
+  thresholds: {
+    http_req_duration: ['p(95)<2000'],
+    http_req_failed: ['rate<0.1'],
+  },
+};
+
+const BASE_URL = __ENV.BASE_URL || 'http://host.docker.internal:3000';
+const ENDPOINT = __ENV.ENDPOINT || '/';
+
+export default function () {
+  const response = http.get(`${BASE_URL}${ENDPOINT}`);
+  check(response, {
+    'status is 200': (r) => r.status === 200,
+    'response time < 2000ms': (r) => r.timings.duration < 2000,
+  });
+  sleep(1);
+}
+'''
+
+
+def _write_if_changed(path: Path, content: str):
+    """Write content to path unless the file already holds exactly that"""
+    if not path.exists() or path.read_text(encoding="utf-8") != content:
+        path.write_text(content, encoding="utf-8")
+
+
+_write_if_changed(LOCUSTFILE_PATH, LOCUSTFILE_TEMPLATE)
+_write_if_changed(K6_SCRIPT_PATH, K6_SCRIPT_TEMPLATE)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestTarget:
     """Represents a testable target"""
     name: str
@@ -49,6 +135,61 @@ class TestTarget:
     endpoints: List[str]
     status: str = "unknown"  # 'online', 'offline', 'unknown'
     response_time: Optional[float] = None
+    safe_name: str = field(init=False, default="")  # name usable in file names
+    response_time_str: str = field(init=False, default="N/A")  # formatted once for table and report
+    
+    def __post_init__(self):
+        self.safe_name = self.name.replace(' ', '_')
+        self.set_response_time(self.response_time)
+    
+    def set_response_time(self, response_time: Optional[float]):
+        self.response_time = response_time
+        self.response_time_str = f"{response_time:.2f}ms" if response_time else "N/A"
+
+
+def _make_connector(limit: int) -> "aiohttp.TCPConnector":
+    """TCP connector that resolves each host once instead of on every request"""
+    import aiohttp
+    
+    return aiohttp.TCPConnector(limit=limit, use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL)
+
+
+# Every step carries these keys, so the report can index them directly
+_STEP_DEFAULTS = {
+    "explanation": "N/A",
+    "success_criteria": "N/A",
+    "failure_criteria": "N/A",
+    "result": None,
+    "error": None,
+}
+
+
+async def _run_command(cmd: List[str], timeout: float,
+                       env: Optional[Dict[str, str]] = None,
+                       stdout=asyncio.subprocess.PIPE) -> subprocess.CompletedProcess:
+    """Run cmd without blocking the event loop, like subprocess.run(capture_output=True, text=True)
+    
+    Pass stdout=subprocess.DEVNULL or an open file to keep the tool's output out of memory;
+    the returned stdout is then None. Only the last STDERR_TAIL characters of stderr are kept.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=stdout,
+        stderr=asyncio.subprocess.PIPE,
+        env=env
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    return subprocess.CompletedProcess(
+        cmd, proc.returncode,
+        stdout.decode("utf-8", errors="replace") if stdout is not None else None,
+        stderr[-STDERR_TAIL:].decode("utf-8", errors="replace")
+    )
 
 
 class TargetDiscovery:
@@ -57,6 +198,8 @@ class TargetDiscovery:
     def __init__(self):
         self.targets: List[TestTarget] = []
         self.discovered_count = 0
+        self.online_count = 0
+        self.offline_count = 0
         
     def discover_automation_targets(self) -> List[TestTarget]:
         """Discover targets from automation-testing-playground"""
@@ -220,20 +363,51 @@ class TargetDiscovery:
         console.print(f"[green]✅ Discovered {len(targets)} pentesting targets[/green]")
         return targets
     
-    def check_target_availability(self, target: TestTarget) -> Tuple[bool, Optional[float]]:
+    async def check_target_availability(self, session: "aiohttp.ClientSession",
+                                        target: TestTarget) -> Tuple[bool, Optional[float]]:
         """Check if target is online and measure response time"""
+        import aiohttp
+        
+        timeout = aiohttp.ClientTimeout(total=5)
         try:
-            start_time = time.time()
-            response = requests.get(target.url, timeout=5, allow_redirects=True)
-            response_time = (time.time() - start_time) * 1000  # Convert to ms
+            start_time = time.perf_counter()
+            # HEAD only moves headers; fall back to GET (body left unread) if HEAD isn't allowed
+            async with session.head(target.url, timeout=timeout, allow_redirects=True) as response:
+                status = response.status
+            if status in (405, 501):
+                async with session.get(target.url, timeout=timeout, allow_redirects=True) as response:
+                    status = response.status
+            response_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
             
-            if response.status_code < 500:
+            if status < 500:
                 return True, response_time
             else:
                 return False, None
         except Exception:
             return False, None
     
+    async def _check_all(self, targets: List[TestTarget]) -> None:
+        """Check every target concurrently - each one is a different host"""
+        import aiohttp  # deferred so --help and report-only paths don't pay for it
+        
+        async def check(session: "aiohttp.ClientSession", target: TestTarget):
+            is_online, response_time = await self.check_target_availability(session, target)
+            
+            if is_online:
+                target.status = "online"
+                target.set_response_time(response_time)
+                self.online_count += 1
+            else:
+                target.status = "offline"
+                self.offline_count += 1
+        
+        connector = _make_connector(limit=32)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            checks = [check(session, target) for target in targets]
+            for pending in track(asyncio.as_completed(checks), total=len(checks),
+                                 description="Checking targets...", console=console):
+                await pending
+    
     def discover_all(self) -> List[TestTarget]:
         """Discover all targets from both repositories"""
         console.print(Panel.fit(
@@ -253,26 +427,8 @@ class TargetDiscovery:
         
         # Check availability
         console.print("\n[cyan]🔍 Checking Target Availability...[/cyan]")
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Checking targets...", total=len(all_targets))
-            
-            for target in all_targets:
-                progress.update(task, description=f"Checking {target.name}...")
-                is_online, response_time = self.check_target_availability(target)
-                
-                if is_online:
-                    target.status = "online"
-                    target.response_time = response_time
-                else:
-                    target.status = "offline"
-                
-                time.sleep(0.2)  # Small delay to avoid overwhelming servers
-                progress.advance(task)
+        self.online_count = self.offline_count = 0
+        asyncio.run(self._check_all(all_targets))
         
         self.targets = all_targets
         self.discovered_count = len(all_targets)
@@ -280,6 +436,10 @@ class TargetDiscovery:
         return all_targets
 
 
+# Where the runner's output goes - a per-target buffer while targets run concurrently
+_runner_console: ContextVar[Console] = ContextVar("runner_console", default=console)
+
+
 class PerformanceTestRunner:
     """Runs performance tests on discovered targets"""
     
@@ -287,67 +447,133 @@ class PerformanceTestRunner:
         self.discovery = discovery
         self.results: List[Dict] = []
         self.steps: List[Dict] = []
+        # Explanations and per-step chatter are in the HTML report; only echo them on request
+        self.verbose = os.environ.get("PERF_VERBOSE") == "1"
+        # Prefer a local k6 binary; otherwise one long-lived container is shared by every k6 test
+        self._k6_native = shutil.which("k6")
+        self._k6_container: Optional[str] = None
+        self._k6_lock = asyncio.Lock()
+    
+    async def _k6_command(self, target: TestTarget, endpoint: str) -> List[str]:
+        """Build the k6 command, starting the shared container on first use"""
+        env_args = ["-e", f"BASE_URL={target.url}", "-e", f"ENDPOINT={endpoint}"]
+        if self._k6_native:
+            return [self._k6_native, "run", *env_args, str(K6_SCRIPT_PATH)]
+        
+        async with self._k6_lock:
+            if self._k6_container is None:
+                # Clear out a container left behind by an interrupted run
+                await _run_command(["docker", "rm", "-f", K6_CONTAINER_NAME], timeout=30)
+                result = await _run_command([
+                    "docker", "run", "-d", "--rm",
+                    "--name", K6_CONTAINER_NAME,
+                    "-v", K6_VOLUME_MOUNT,
+                    "--entrypoint", "tail",
+                    "grafana/k6:latest",
+                    "-f", "/dev/null"
+                ], timeout=120)
+                if result.returncode != 0:
+                    raise RuntimeError(f"Could not start k6 container: {result.stderr.strip()}")
+                self._k6_container = K6_CONTAINER_NAME
+        
+        return ["docker", "exec", *env_args, self._k6_container, "k6", "run", K6_CONTAINER_SCRIPT]
+    
+    def close(self):
+        """Remove the shared k6 container, if one was started"""
+        if self._k6_container is not None:
+            subprocess.run(["docker", "rm", "-f", self._k6_container], capture_output=True)
+            self._k6_container = None
+    
+    @property
+    def _console(self) -> Console:
+        return _runner_console.get()
+    
+    def _print_step_header(self, step_info: Dict):
+        """Print the step title, plus its explanation and criteria in verbose mode"""
+        self._console.print(f"\n[yellow]📊 Step: {step_info['step']}[/yellow]")
+        if self.verbose:
+            self._console.print(f"[dim]Action: {step_info['action']}[/dim]")
+            self._console.print(f"[dim]📖 Explanation: {step_info['explanation']}[/dim]")
+            self._console.print(f"[dim]✅ Success Looks Like: {step_info['success_criteria']}[/dim]")
+            self._console.print(f"[dim]❌ Failure Looks Like: {step_info['failure_criteria']}[/dim]")
+        
+    async def run_basic_load_test(self, target: TestTarget, endpoint: str) -> Dict:
+        """Run a basic load test using aiohttp"""
+        import aiohttp
         
-    def run_basic_load_test(self, target: TestTarget, endpoint: str) -> Dict:
-        """Run a basic load test using requests"""
         step_info = {
+            **_STEP_DEFAULTS,
             "step": f"Load Test - {target.name} - {endpoint}",
             "action": "Running basic load test",
-            "tool": "Python requests",
+            "tool": "Python aiohttp",
             "status": "running",
-            "explanation": "This test sends multiple concurrent HTTP requests to measure response times and success rates.",
+            "explanation": "This test sends multiple concurrent HTTP requests to measure response times and success rates. Response times are measured to the response headers; bodies are not downloaded.",
             "success_criteria": "At least 80% of requests should succeed with average response time < 1000ms",
             "failure_criteria": "If more than 20% requests fail or average response time exceeds 2000ms, the test fails"
         }
         self.steps.append(step_info)
         
-        console.print(f"\n[yellow]📊 Step: {step_info['step']}[/yellow]")
-        console.print(f"[dim]Action: {step_info['action']}[/dim]")
-        console.print(f"[dim]📖 Explanation: {step_info['explanation']}[/dim]")
-        console.print(f"[dim]✅ Success Looks Like: {step_info['success_criteria']}[/dim]")
-        console.print(f"[dim]❌ Failure Looks Like: {step_info['failure_criteria']}[/dim]")
+        self._print_step_header(step_info)
         
         try:
             num_requests = 20
             concurrent = 5
-            response_times = []
             success_count = 0
             failure_count = 0
             
-            console.print(f"[dim]   → Sending {num_requests} requests with {concurrent} concurrent users[/dim]")
+            url = f"{target.url}{endpoint}"
             
-            from concurrent.futures import ThreadPoolExecutor, as_completed
+            if self.verbose:
+                self._console.print(f"[dim]   → Sending {num_requests} requests with {concurrent} concurrent users[/dim]")
             
-            def make_request():
-                try:
-                    start = time.time()
-                    url = f"{target.url}{endpoint}"
-                    response = requests.get(url, timeout=10)
-                    elapsed = (time.time() - start) * 1000
-                    
-                    if response.status_code < 400:
-                        return {"success": True, "time": elapsed, "status": response.status_code}
-                    else:
-                        return {"success": False, "time": elapsed, "status": response.status_code}
-                except Exception as e:
-                    return {"success": False, "time": 0, "error": str(e)}
+            async def make_request(session, users):
+                # Start the clock only once a "user" slot is free, so queueing isn't timed
+                async with users:
+                    try:
+                        start = time.perf_counter()
+                        # Only the status is used - release the response without downloading the body
+                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                            elapsed = (time.perf_counter() - start) * 1000
+                            
+                            if response.status < 400:
+                                return {"success": True, "time": elapsed, "status": response.status}
+                            else:
+                                return {"success": False, "time": elapsed, "status": response.status}
+                    except Exception as e:
+                        return {"success": False, "time": 0, "error": str(e)}
             
-            with ThreadPoolExecutor(max_workers=concurrent) as executor:
-                futures = [executor.submit(make_request) for _ in range(num_requests)]
-                
-                for future in as_completed(futures):
-                    result = future.result()
-                    if result["success"]:
-                        success_count += 1
-                        response_times.append(result["time"])
-                    else:
-                        failure_count += 1
+            async def send_all():
+                users = asyncio.Semaphore(concurrent)
+                connector = _make_connector(limit=concurrent)
+                async with aiohttp.ClientSession(connector=connector) as session:
+                    return await asyncio.gather(
+                        *[make_request(session, users) for _ in range(num_requests)],
+                        return_exceptions=True
+                    )
+            
+            wall_start = time.perf_counter()
+            results = await send_all()
+            wall_time = time.perf_counter() - wall_start
+            
+            # Single pass: running sum/min/max instead of re-scanning a list of samples
+            rt_sum = 0.0
+            min_time = float("inf")
+            max_time = 0.0
+            for result in results:
+                if isinstance(result, dict) and result["success"]:
+                    success_count += 1
+                    rt = result["time"]
+                    rt_sum += rt
+                    if rt < min_time:
+                        min_time = rt
+                    if rt > max_time:
+                        max_time = rt
+                else:
+                    failure_count += 1
             
-            if response_times:
-                avg_time = sum(response_times) / len(response_times)
-                min_time = min(response_times)
-                max_time = max(response_times)
-                throughput = len(response_times) / (max(response_times) / 1000) if response_times else 0
+            if success_count:
+                avg_time = rt_sum / success_count
+                throughput = success_count / wall_time if wall_time > 0 else 0
             else:
                 avg_time = min_time = max_time = throughput = 0
             
@@ -377,32 +603,43 @@ class PerformanceTestRunner:
                 "verdict": verdict
             }
             
-            console.print(f"[{verdict_color}]{verdict}[/{verdict_color}]")
-            console.print(f"[dim]   → Success Rate: {success_count}/{num_requests} ({success_rate:.1f}%)[/dim]")
-            console.print(f"[dim]   → Avg Response Time: {avg_time:.2f}ms[/dim]")
-            console.print(f"[dim]   → Min/Max: {min_time:.2f}ms / {max_time:.2f}ms[/dim]")
-            console.print(f"[dim]   → Throughput: {throughput:.2f} req/s[/dim]")
-            
             if step_info["status"] == "passed":
-                console.print(f"[green]   ✓ Criteria met: {success_rate:.1f}% success rate and {avg_time:.2f}ms avg response time[/green]")
+                criteria = f"[green]   ✓ Criteria met: {success_rate:.1f}% success rate and {avg_time:.2f}ms avg response time[/green]"
             elif step_info["status"] == "warning":
-                console.print(f"[yellow]   ⚠ Some criteria not met but acceptable performance[/yellow]")
+                criteria = "[yellow]   ⚠ Some criteria not met but acceptable performance[/yellow]"
             else:
-                console.print(f"[red]   ✗ Criteria not met: Success rate too low or response time too high[/red]")
+                criteria = "[red]   ✗ Criteria not met: Success rate too low or response time too high[/red]"
+            
+            # One table, one print - instead of a console.print per metric
+            table = Table(
+                title=f"[{verdict_color}]{verdict}[/{verdict_color}]",
+                title_justify="left",
+                show_header=False,
+                box=None,
+                padding=(0, 1, 0, 3)
+            )
+            table.add_column(style="dim")
+            table.add_column(style="dim")
+            table.add_row("Success Rate", f"{success_count}/{num_requests} ({success_rate:.1f}%)")
+            table.add_row("Avg Response Time", f"{avg_time:.2f}ms")
+            table.add_row("Min/Max", f"{min_time:.2f}ms / {max_time:.2f}ms")
+            table.add_row("Throughput", f"{throughput:.2f} req/s")
+            self._console.print(table, criteria)
             
             return step_info["result"]
             
         except Exception as e:
             step_info["status"] = "failed"
             step_info["error"] = str(e)
-            console.print(f"[red]❌ FAILED[/red]")
-            console.print(f"[dim]   → Error: {str(e)}[/dim]")
-            console.print(f"[red]   ✗ Test execution failed due to exception[/red]")
+            self._console.print(f"[red]❌ FAILED[/red]")
+            self._console.print(f"[dim]   → Error: {str(e)}[/dim]")
+            self._console.print(f"[red]   ✗ Test execution failed due to exception[/red]")
             return {"error": str(e)}
     
-    def run_locust_test(self, target: TestTarget, endpoint: str) -> Dict:
+    async def run_locust_test(self, target: TestTarget, endpoint: str) -> Dict:
         """Run Locust performance test"""
         step_info = {
+            **_STEP_DEFAULTS,
             "step": f"Locust Test - {target.name} - {endpoint}",
             "action": "Running Locust load test",
             "tool": "Locust",
@@ -413,208 +650,146 @@ class PerformanceTestRunner:
         }
         self.steps.append(step_info)
         
-        console.print(f"\n[yellow]📊 Step: {step_info['step']}[/yellow]")
-        console.print(f"[dim]Action: {step_info['action']}[/dim]")
-        console.print(f"[dim]📖 Explanation: {step_info['explanation']}[/dim]")
-        console.print(f"[dim]✅ Success Looks Like: {step_info['success_criteria']}[/dim]")
-        console.print(f"[dim]❌ Failure Looks Like: {step_info['failure_criteria']}[/dim]")
+        self._print_step_header(step_info)
         
         try:
-            # Create temporary locustfile
-            locustfile_content = f'''
-from locust import HttpUser, task, between
-
-class QuickTestUser(HttpUser):
-    wait_time = between(1, 2)
-    
-    @task
-    def test_endpoint(self):
-        self.client.get("{endpoint}", name="{endpoint}")
-'''
+            safe = target.safe_name
+            report_html = str(RESULTS_DIR / f"locust_report_{safe}.html")
+            csv_prefix = str(RESULTS_DIR / f"locust_results_{safe}")
             
-            locustfile_path = RESULTS_DIR / f"locustfile_{target.name.replace(' ', '_')}.py"
-            locustfile_path.write_text(locustfile_content)
-            
-            console.print(f"[dim]   → Creating Locust test file[/dim]")
-            console.print(f"[dim]   → Target: {target.url}{endpoint}[/dim]")
-            console.print(f"[dim]   → Running with 10 users for 30 seconds...[/dim]")
+            self._console.print(f"[dim]   → Using shared Locust test file[/dim]")
+            self._console.print(f"[dim]   → Target: {target.url}{endpoint}[/dim]")
+            self._console.print(f"[dim]   → Running with 10 users for 30 seconds...[/dim]")
             
             # Run Locust
             cmd = [
                 sys.executable, "-m", "locust",
-                "-f", str(locustfile_path),
+                "-f", str(LOCUSTFILE_PATH),
                 "--host", target.url,
                 "--users", "10",
                 "--spawn-rate", "2",
                 "--run-time", "30s",
                 "--headless",
-                "--html", str(RESULTS_DIR / f"locust_report_{target.name.replace(' ', '_')}.html"),
-                "--csv", str(RESULTS_DIR / f"locust_results_{target.name.replace(' ', '_')}")
+                "--html", report_html,
+                "--csv", csv_prefix
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            # Locust's progress output is never read again - the HTML report is the artifact
+            result = await _run_command(cmd, timeout=60, env={**os.environ, "PERF_ENDPOINT": endpoint},
+                                        stdout=subprocess.DEVNULL)
             
             if result.returncode == 0:
                 step_info["status"] = "passed"
                 step_info["result"] = {
-                    "locust_output": result.stdout,
-                    "report_path": str(RESULTS_DIR / f"locust_report_{target.name.replace(' ', '_')}.html")
+                    "report_path": report_html
                 }
-                console.print(f"[green]✅ PASSED[/green]")
-                console.print(f"[dim]   → Report saved to: {step_info['result']['report_path']}[/dim]")
-                console.print(f"[green]   ✓ Locust test completed successfully and generated HTML report[/green]")
+                self._console.print(f"[green]✅ PASSED[/green]")
+                self._console.print(f"[dim]   → Report saved to: {report_html}[/dim]")
+                self._console.print(f"[green]   ✓ Locust test completed successfully and generated HTML report[/green]")
             else:
                 step_info["status"] = "failed"
                 step_info["error"] = result.stderr
-                console.print(f"[red]❌ FAILED[/red]")
-                console.print(f"[dim]   → Error: {result.stderr[:200]}[/dim]")
-                console.print(f"[red]   ✗ Locust test failed - check errors above[/red]")
+                self._console.print(f"[red]❌ FAILED[/red]")
+                self._console.print(f"[dim]   → Error: {result.stderr[:200]}[/dim]")
+                self._console.print(f"[red]   ✗ Locust test failed - check errors above[/red]")
             
-            return step_info.get("result", {})
+            return step_info["result"] or {}
             
         except Exception as e:
             step_info["status"] = "failed"
             step_info["error"] = str(e)
-            console.print(f"[red]❌ FAILED[/red]")
-            console.print(f"[dim]   → Error: {str(e)}[/dim]")
+            self._console.print(f"[red]❌ FAILED[/red]")
+            self._console.print(f"[dim]   → Error: {str(e)}[/dim]")
             return {"error": str(e)}
     
-    def run_k6_test(self, target: TestTarget, endpoint: str) -> Dict:
-        """Run k6 performance test via Docker"""
+    async def run_k6_test(self, target: TestTarget, endpoint: str) -> Dict:
+        """Run k6 performance test with a local k6 binary or the shared Docker container"""
+        runner = "the local k6 binary" if self._k6_native else "the shared Docker container"
         step_info = {
+            **_STEP_DEFAULTS,
             "step": f"k6 Test - {target.name} - {endpoint}",
-            "action": "Running k6 load test via Docker",
+            "action": f"Running k6 load test via {runner}",
             "tool": "k6",
             "status": "running",
-            "explanation": "k6 runs in Docker container and performs load testing with configurable stages (ramp-up, sustain, ramp-down).",
+            "explanation": f"k6 runs via {runner} and performs load testing with configurable stages (ramp-up, sustain, ramp-down).",
             "success_criteria": "k6 completes all stages successfully and shows metrics within thresholds (p95 < 2000ms, error rate < 10%)",
-            "failure_criteria": "Test fails if Docker unavailable, k6 crashes, or thresholds are exceeded"
+            "failure_criteria": f"Test fails if {'k6' if self._k6_native else 'Docker'} is unavailable, k6 crashes, or thresholds are exceeded"
         }
         self.steps.append(step_info)
         
-        console.print(f"\n[yellow]📊 Step: {step_info['step']}[/yellow]")
-        console.print(f"[dim]Action: {step_info['action']}[/dim]")
-        console.print(f"[dim]📖 Explanation: {step_info['explanation']}[/dim]")
-        console.print(f"[dim]✅ Success Looks Like: {step_info['success_criteria']}[/dim]")
-        console.print(f"[dim]❌ Failure Looks Like: {step_info['failure_criteria']}[/dim]")
+        self._print_step_header(step_info)
         
         try:
-            # Create k6 test script
-            k6_script = f'''
-import http from 'k6/http';
-import {{ check, sleep }} from 'k6';
-
-export const options = {{
-  stages: [
-    {{ duration: '10s', target: 5 }},
-    {{ duration: '20s', target: 5 }},
-    {{ duration: '10s', target: 0 }},
-  ],
-  thresholds: {{
-    http_req_duration: ['p(95)<2000'],
-    http_req_failed: ['rate<0.1'],
-  }},
-}};
-
-const BASE_URL = __ENV.BASE_URL || '{target.url}';
-
-export default function () {{
-  const response = http.get(`${{BASE_URL}}{endpoint}`);
-  check(response, {{
-    'status is 200': (r) => r.status === 200,
-    'response time < 2000ms': (r) => r.timings.duration < 2000,
-  }});
-  sleep(1);
-}}
-'''
+            self._console.print(f"[dim]   → Using shared k6 test script[/dim]")
+            self._console.print(f"[dim]   → Target: {target.url}{endpoint}[/dim]")
+            self._console.print(f"[dim]   → Running via {'local k6' if self._k6_native else 'Docker'}...[/dim]")
             
-            k6_file = RESULTS_DIR / f"k6_test_{target.name.replace(' ', '_')}.js"
-            k6_file.write_text(k6_script)
+            cmd = await self._k6_command(target, endpoint)
             
-            console.print(f"[dim]   → Creating k6 test script[/dim]")
-            console.print(f"[dim]   → Target: {target.url}{endpoint}[/dim]")
-            console.print(f"[dim]   → Running via Docker...[/dim]")
-            
-            # Run k6 via Docker
-            volume_mount = f"{RESULTS_DIR.absolute()}:/scripts"
-            cmd = [
-                "docker", "run", "--rm", "-i",
-                "-v", volume_mount,
-                "-e", f"BASE_URL={target.url}",
-                "grafana/k6:latest",
-                "run", f"/scripts/{k6_file.name}"
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            # Stream the k6 summary straight to disk instead of buffering it
+            log_path = RESULTS_DIR / f"k6_output_{target.safe_name}.log"
+            with log_path.open("wb") as log_file:
+                result = await _run_command(cmd, timeout=60, stdout=log_file)
             
             if result.returncode == 0:
                 step_info["status"] = "passed"
                 step_info["result"] = {
-                    "k6_output": result.stdout,
-                    "test_script": str(k6_file)
+                    "k6_output": str(log_path),
+                    "test_script": str(K6_SCRIPT_PATH)
                 }
-                console.print(f"[green]✅ PASSED[/green]")
-                console.print(f"[dim]   → k6 test completed successfully[/dim]")
-                console.print(f"[green]   ✓ All k6 stages completed within thresholds[/green]")
+                self._console.print(f"[green]✅ PASSED[/green]")
+                self._console.print(f"[dim]   → k6 test completed successfully - output saved to: {log_path}[/dim]")
+                self._console.print(f"[green]   ✓ All k6 stages completed within thresholds[/green]")
             else:
                 step_info["status"] = "failed"
                 step_info["error"] = result.stderr
-                console.print(f"[red]❌ FAILED[/red]")
-                console.print(f"[dim]   → Error: {result.stderr[:200]}[/dim]")
-                console.print(f"[red]   ✗ k6 test failed - check Docker or thresholds[/red]")
+                self._console.print(f"[red]❌ FAILED[/red]")
+                self._console.print(f"[dim]   → Error: {result.stderr[:200]}[/dim]")
+                self._console.print(f"[red]   ✗ k6 test failed - check Docker or thresholds[/red]")
             
-            return step_info.get("result", {})
+            return step_info["result"] or {}
             
         except FileNotFoundError:
             step_info["status"] = "skipped"
             step_info["reason"] = "Docker not available"
-            console.print(f"[yellow]⚠️  SKIPPED[/yellow]")
-            console.print(f"[dim]   → Docker not found - skipping k6 test[/dim]")
-            console.print(f"[yellow]   ⚠ Docker unavailable - install Docker Desktop to run k6 tests[/yellow]")
+            self._console.print(f"[yellow]⚠️  SKIPPED[/yellow]")
+            self._console.print(f"[dim]   → Docker not found - skipping k6 test[/dim]")
+            self._console.print(f"[yellow]   ⚠ Docker unavailable - install Docker Desktop to run k6 tests[/yellow]")
             return {"skipped": True, "reason": "Docker not available"}
         except Exception as e:
             step_info["status"] = "failed"
             step_info["error"] = str(e)
-            console.print(f"[red]❌ FAILED[/red]")
-            console.print(f"[dim]   → Error: {str(e)}[/dim]")
+            self._console.print(f"[red]❌ FAILED[/red]")
+            self._console.print(f"[dim]   → Error: {str(e)}[/dim]")
             return {"error": str(e)}
     
-    def run_tests_on_target(self, target: TestTarget):
+    async def run_tests_on_target(self, target: TestTarget):
         """Run performance tests on a single target"""
-        console.print(f"\n[bold cyan]🎯 Testing Target: {target.name}[/bold cyan]")
-        console.print(f"[dim]URL: {target.url}[/dim]")
-        console.print(f"[dim]Status: {target.status}[/dim]")
+        self._console.print(f"\n[bold cyan]🎯 Testing Target: {target.name}[/bold cyan]")
+        self._console.print(f"[dim]URL: {target.url}[/dim]")
+        self._console.print(f"[dim]Status: {target.status}[/dim]")
         
         if target.status != "online":
-            console.print(f"[yellow]⚠️  Skipping offline target[/yellow]")
+            self._console.print(f"[yellow]⚠️  Skipping offline target[/yellow]")
             return
         
         # Test main endpoint
         main_endpoint = target.endpoints[0] if target.endpoints else "/"
         
         # Run basic load test
-        basic_result = self.run_basic_load_test(target, main_endpoint)
+        basic_result = await self.run_basic_load_test(target, main_endpoint)
         
-        # Try Locust if available
-        try:
-            import locust
-            locust_result = self.run_locust_test(target, main_endpoint)
-        except ImportError:
-            console.print(f"[yellow]⚠️  Locust not available - skipping[/yellow]")
+        # Try Locust if available - find_spec avoids importing it (and gevent) here.
+        # The repo's own locust/ folder resolves as a namespace package with no origin.
+        locust_spec = importlib.util.find_spec("locust")
+        if locust_spec is None or locust_spec.origin is None:
+            self._console.print(f"[yellow]⚠️  Locust not available - skipping[/yellow]")
             locust_result = {"skipped": True}
+        else:
+            locust_result = await self.run_locust_test(target, main_endpoint)
         
         # Try k6 if Docker available
-        k6_result = self.run_k6_test(target, main_endpoint)
+        k6_result = await self.run_k6_test(target, main_endpoint)
         
         self.results.append({
             "target": target.name,
@@ -624,11 +799,85 @@ export default function () {{
             "locust_test": locust_result,
             "k6_test": k6_result
         })
+    
+    async def run_all_targets(self, targets: List[TestTarget], max_concurrent: int = 16):
+        """Test several targets at once - each is a different host, so their runs overlap
+        
+        With more than one target, each target's output is buffered and printed as one
+        block when it finishes, so concurrent runs don't interleave.
+        """
+        limit = asyncio.Semaphore(max(1, min(max_concurrent, len(targets))))
+        
+        async def run_one(target: TestTarget):
+            async with limit:
+                if len(targets) == 1:
+                    await self.run_tests_on_target(target)
+                    return
+                
+                # gather runs each call in its own task, so this only affects this target
+                out = Console(
+                    file=io.StringIO(),
+                    force_terminal=console.is_terminal,
+                    color_system=console.color_system,
+                    width=console.width
+                )
+                _runner_console.set(out)
+                try:
+                    await self.run_tests_on_target(target)
+                finally:
+                    console.print(Text.from_ansi(out.file.getvalue()), end="")
+        
+        if len(targets) > 1:
+            console.print(f"[dim]Testing {len(targets)} targets concurrently - each target's output is shown when it finishes[/dim]")
+        await asyncio.gather(*(run_one(target) for target in targets))
+
+
+if orjson is not None:
+    def _dumps_pretty(value) -> str:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+else:
+    def _dumps_pretty(value) -> str:
+        return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+# status -> (CSS class, emoji) for the report's discovery table and step cards
+_TARGET_STYLE = {"online": ("status-online", "✅")}
+_TARGET_STYLE_DEFAULT = ("status-offline", "❌")
+_STEP_STYLE = {
+    "passed": ("result-passed", "✅"),
+    "failed": ("result-failed", "❌"),
+    "warning": ("result-warning", "⚠️"),
+    "skipped": ("result-skipped", "⚠️"),
+}
+_STEP_STYLE_DEFAULT = _STEP_STYLE["skipped"]
 
 
 class ReportGenerator:
     """Generates detailed, emoji-rich performance test reports"""
     
+    _template = None  # compiled on first use, then shared by every report
+    
+    @classmethod
+    def _get_template(cls):
+        if cls._template is None:
+            # Target names, URLs and tool errors come from outside - escape them
+            env = Environment(
+                loader=FileSystemLoader(REPORT_TEMPLATES_DIR),
+                autoescape=True,
+                auto_reload=False,
+                cache_size=-1,
+                trim_blocks=True,
+                lstrip_blocks=True,
+                keep_trailing_newline=True
+            )
+            env.filters["pretty_json"] = _dumps_pretty
+            env.globals.update(
+                TARGET_STYLE=_TARGET_STYLE, TARGET_STYLE_DEFAULT=_TARGET_STYLE_DEFAULT,
+                STEP_STYLE=_STEP_STYLE, STEP_STYLE_DEFAULT=_STEP_STYLE_DEFAULT
+            )
+            cls._template = env.get_template("cross_repo_report.html.j2")
+        return cls._template
+    
     def __init__(self, discovery: TargetDiscovery, runner: PerformanceTestRunner):
         self.discovery = discovery
         self.runner = runner
@@ -638,259 +887,21 @@ class ReportGenerator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = RESULTS_DIR / f"cross_repo_performance_report_{timestamp}.html"
         
-        html_content = f'''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Cross-Repository Performance Test Report</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 30px;
-            border-left: 4px solid #3498db;
-            padding-left: 10px;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }}
-        .summary-card {{
-            background: #ecf0f1;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-        }}
-        .summary-card h3 {{
-            margin: 0 0 10px 0;
-            color: #2c3e50;
-        }}
-        .summary-card .number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #3498db;
-        }}
-        .target-card {{
-            background: #f8f9fa;
-            border: 1px solid #dee2e6;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 20px 0;
-        }}
-        .target-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-        .status-badge {{
-            padding: 5px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-        }}
-        .status-online {{
-            background: #d4edda;
-            color: #155724;
-        }}
-        .status-offline {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-        .step {{
-            background: white;
-            border-left: 4px solid #3498db;
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 4px;
-        }}
-        .step-header {{
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }}
-        .step-result {{
-            margin-top: 10px;
-            padding: 10px;
-            border-radius: 4px;
-        }}
-        .result-passed {{
-            background: #d4edda;
-            color: #155724;
-        }}
-        .result-failed {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-        .result-skipped {{
-            background: #fff3cd;
-            color: #856404;
-        }}
-        .result-warning {{
-            background: #fff3cd;
-            color: #856404;
-            border-left: 4px solid #ffc107;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #dee2e6;
-        }}
-        th {{
-            background: #3498db;
-            color: white;
-        }}
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        .emoji {{
-            font-size: 1.2em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🚀 Cross-Repository Performance Test Report</h1>
-        <p><strong>Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-        
-        <div class="summary">
-            <div class="summary-card">
-                <h3>🎯 Total Targets</h3>
-                <div class="number">{len(self.discovery.targets)}</div>
-            </div>
-            <div class="summary-card">
-                <h3>✅ Online Targets</h3>
-                <div class="number">{len([t for t in self.discovery.targets if t.status == 'online'])}</div>
-            </div>
-            <div class="summary-card">
-                <h3>❌ Offline Targets</h3>
-                <div class="number">{len([t for t in self.discovery.targets if t.status == 'offline'])}</div>
-            </div>
-            <div class="summary-card">
-                <h3>📊 Tests Run</h3>
-                <div class="number">{len(self.runner.results)}</div>
-            </div>
-        </div>
-        
-        <h2>📋 Discovery Summary</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Name</th>
-                    <th>URL</th>
-                    <th>Repository</th>
-                    <th>Type</th>
-                    <th>Status</th>
-                    <th>Response Time</th>
-                </tr>
-            </thead>
-            <tbody>
-'''
-        
-        for target in self.discovery.targets:
-            status_class = "status-online" if target.status == "online" else "status-offline"
-            status_emoji = "✅" if target.status == "online" else "❌"
-            response_time_str = f"{target.response_time:.2f}ms" if target.response_time else "N/A"
-            
-            html_content += f'''
-                <tr>
-                    <td><strong>{target.name}</strong></td>
-                    <td>{target.url}</td>
-                    <td>{target.repo}</td>
-                    <td>{target.type}</td>
-                    <td><span class="status-badge {status_class}">{status_emoji} {target.status.upper()}</span></td>
-                    <td>{response_time_str}</td>
-                </tr>
-'''
-        
-        html_content += '''
-            </tbody>
-        </table>
-        
-        <h2>📊 Test Execution Steps</h2>
-'''
-        
-        for step in self.runner.steps:
-            status_class = "result-passed" if step["status"] == "passed" else ("result-failed" if step["status"] == "failed" else ("result-warning" if step["status"] == "warning" else "result-skipped"))
-            status_emoji = "✅" if step["status"] == "passed" else ("❌" if step["status"] == "failed" else ("⚠️" if step["status"] == "warning" else "⚠️"))
-            
-            html_content += f'''
-        <div class="step">
-            <div class="step-header">{status_emoji} {step["step"]}</div>
-            <p><strong>Action:</strong> {step["action"]}</p>
-            <p><strong>Tool:</strong> {step["tool"]}</p>
-            <p><strong>📖 Explanation:</strong> {step.get("explanation", "N/A")}</p>
-            <p><strong>✅ Success Looks Like:</strong> <span style="color: #155724;">{step.get("success_criteria", "N/A")}</span></p>
-            <p><strong>❌ Failure Looks Like:</strong> <span style="color: #721c24;">{step.get("failure_criteria", "N/A")}</span></p>
-            <div class="step-result {status_class}">
-                <strong>Status:</strong> {step["status"].upper()}
-'''
-            
-            if "result" in step:
-                html_content += f'<pre>{json.dumps(step["result"], indent=2)}</pre>'
-            if "error" in step:
-                html_content += f'<p><strong>Error:</strong> {step["error"]}</p>'
-            
-            html_content += '''
-            </div>
-        </div>
-'''
-        
-        html_content += '''
-        <h2>📈 Detailed Results</h2>
-'''
-        
-        for result in self.runner.results:
-            html_content += f'''
-        <div class="target-card">
-            <div class="target-header">
-                <h3>{result["target"]}</h3>
-                <span>{result["url"]}{result["endpoint"]}</span>
-            </div>
-            <h4>Basic Load Test</h4>
-            <pre>{json.dumps(result["basic_test"], indent=2)}</pre>
-            <h4>Locust Test</h4>
-            <pre>{json.dumps(result.get("locust_test", {}), indent=2)}</pre>
-            <h4>k6 Test</h4>
-            <pre>{json.dumps(result.get("k6_test", {}), indent=2)}</pre>
-        </div>
-'''
-        
-        html_content += '''
-    </div>
-</body>
-</html>
-'''
+        stream = self._get_template().stream(
+            generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            total_targets=len(self.discovery.targets),
+            online_targets=self.discovery.online_count,
+            offline_targets=self.discovery.offline_count,
+            tests_run=len(self.runner.results),
+            targets=self.discovery.targets,
+            steps=self.runner.steps,
+            results=self.runner.results,
+        )
+        # Write fragments through a large buffer as they render - memory stays
+        # bounded by the buffer rather than growing with the report
+        with report_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+            stream.dump(fh)
         
-        report_path.write_text(html_content, encoding='utf-8')
         return str(report_path)
 
 
@@ -915,16 +926,13 @@ def main():
     table.add_column("Status", style="magenta")
     table.add_column("Response Time", style="blue")
     
-    for target in targets:
-        status_emoji = "✅" if target.status == "online" else "❌"
-        response_time_str = f"{target.response_time:.2f}ms" if target.response_time else "N/A"
-        table.add_row(
-            target.name,
-            target.url,
-            target.repo,
-            f"{status_emoji} {target.status}",
-            response_time_str
-        )
+    rows = [
+        (t.name, t.url, t.repo, f"{'✅' if t.status == 'online' else '❌'} {t.status}", t.response_time_str)
+        for t in targets
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
     
     console.print(table)
     
@@ -935,8 +943,10 @@ def main():
     online_targets = [t for t in targets if t.status == "online"]
     console.print(f"[cyan]Found {len(online_targets)} online targets to test[/cyan]")
     
-    for target in online_targets[:5]:  # Limit to 5 for demo
-        runner.run_tests_on_target(target)
+    try:
+        asyncio.run(runner.run_all_targets(online_targets))
+    finally:
+        runner.close()
     
     # Step 3: Reporting
     console.print("\n[bold]Step 3: Report Generation[/bold]")
@@ -947,9 +957,10 @@ def main():
     console.print(f"[cyan]📊 Report saved to: {report_path}[/cyan]")
     
     # Summary
-    passed_steps = len([s for s in runner.steps if s["status"] == "passed"])
-    failed_steps = len([s for s in runner.steps if s["status"] == "failed"])
-    skipped_steps = len([s for s in runner.steps if s["status"] == "skipped"])
+    status_counts = Counter(s["status"] for s in runner.steps)
+    passed_steps = status_counts["passed"]
+    failed_steps = status_counts["failed"]
+    skipped_steps = status_counts["skipped"]
     
     console.print(f"\n[bold]Summary:[/bold]")
     console.print(f"  ✅ Passed: {passed_steps}")
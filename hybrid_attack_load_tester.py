@@ -9,23 +9,32 @@ if systems become more vulnerable under load.
 
 import sys
 import os
+import re
+import statistics
+from array import array
 import io
-import requests
+import asyncio
+import aiohttp
 import time
 import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from datetime import datetime
+from html import escape as _esc
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import json
 
-# Fix Windows encoding
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+# Fix Windows encoding - reconfigure in place rather than stacking another wrapper
+# (replaced streams such as pytest's capture or io.StringIO have no reconfigure)
+try:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+except AttributeError:
+    pass
 
 console = Console()
 
@@ -36,6 +45,9 @@ PENTESTING_REPO = WORKSPACE_ROOT / "pentesting-playground"
 RESULTS_DIR = SCRIPT_DIR / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
 
+# Attack checks only look for error signatures / reflected payloads, which show up early
+MAX_BODY_BYTES = 64 * 1024
+
 # Import attack modules from pentesting-playground
 sys.path.insert(0, str(PENTESTING_REPO / "tools" / "attacks"))
 try:
@@ -46,6 +58,29 @@ except ImportError:
     sys.exit(1)
 
 
+async def _read_body_head(response: aiohttp.ClientResponse) -> bytes:
+    """Read at most MAX_BODY_BYTES of the body; the rest is never downloaded"""
+    head = bytearray()
+    while len(head) < MAX_BODY_BYTES:
+        chunk = await response.content.read(MAX_BODY_BYTES - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return bytes(head)
+
+
+def _url_with_param(url: str, parameter: str, value: str) -> str:
+    """Set parameter to value in url's query string, replacing any existing value
+    
+    Endpoints like `/search?q=` already name the parameter; appending a second `q`
+    would make the server see an array instead of the payload.
+    """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != parameter]
+    query.append((parameter, value))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
 @dataclass
 class AttackResult:
     """Result of a vulnerability attack"""
@@ -71,6 +106,9 @@ class LoadTestResult:
     max_response_time: float
     throughput: float
     error_count: int = 0
+    p50_response_time: float = 0.0
+    p95_response_time: float = 0.0
+    p99_response_time: float = 0.0
 
 
 @dataclass
@@ -96,16 +134,24 @@ class HybridAttackLoadTester:
         self.is_running = False
         self.stop_event = threading.Event()
         
-        # Initialize attack testers
-        self.sqli_tester = SQLInjectionTester(self.target_url)
-        self.xss_tester = XSSTester(self.target_url)
+        # Initialize only the attack testers that will be used
+        self.sqli_tester = SQLInjectionTester(self.target_url) if 'sqli' in self.attack_types else None
+        self.xss_tester = XSSTester(self.target_url) if 'xss' in self.attack_types else None
+        
+        # One case-insensitive pass over the raw body bytes finds any SQL error pattern -
+        # the signatures are ASCII, so there's no need to decode the response first
+        patterns = self.sqli_tester.error_patterns if self.sqli_tester else None
+        self._sqli_error_re = (
+            re.compile(b'|'.join(re.escape(p.encode('utf-8')) for p in patterns), re.IGNORECASE)
+            if patterns else None
+        )
         
     def run_baseline_attack(self, endpoint: str, parameter: str = "id") -> Optional[AttackResult]:
         """Run vulnerability attack without load to establish baseline"""
         console.print(f"[dim]📋 Running baseline attack on {endpoint}...[/dim]")
         
         vulnerabilities = []
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Test SQL Injection
         if 'sqli' in self.attack_types:
@@ -123,7 +169,7 @@ class HybridAttackLoadTester:
             except Exception as e:
                 pass
         
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.perf_counter() - start_time) * 1000
         
         if vulnerabilities:
             vuln = vulnerabilities[0]
@@ -144,64 +190,90 @@ class HybridAttackLoadTester:
                       concurrent_users: int = 50, rate_per_second: int = 10) -> LoadTestResult:
         """Run load/flood test on endpoint"""
         console.print(f"[yellow]🌊 Starting load flood: {concurrent_users} concurrent users for {duration}s[/yellow]")
-        
+        return asyncio.run(self._flood(endpoint, duration, concurrent_users, rate_per_second))
+    
+    async def _flood(self, endpoint: str, duration: int,
+                     concurrent_users: int, rate_per_second: int) -> LoadTestResult:
+        """Flood endpoint from one event loop - concurrent_users requests in flight at most"""
         url = f"{self.target_url}{endpoint}"
-        response_times = []
+        timeout = aiohttp.ClientTimeout(total=5)
+        
+        async def make_request(session, users) -> Tuple[float, bool]:
+            """Return (elapsed ms, status ok); connection errors propagate"""
+            async with users:
+                req_start = time.perf_counter()
+                # Only the status matters - release the response without downloading the body
+                async with session.get(url, timeout=timeout) as response:
+                    elapsed = (time.perf_counter() - req_start) * 1000
+                    return elapsed, response.status < 400
+        
+        response_times = array('d')  # packed doubles, not a list of float objects
         success_count = 0
-        failure_count = 0
         error_count = 0
-        start_time = time.time()
         request_count = 0
+        in_flight = set()
         
-        def make_request():
-            nonlocal success_count, failure_count, error_count, request_count
+        def on_done(task: asyncio.Task):
+            """Tally a finished request - the only place the counters change"""
+            nonlocal success_count, error_count
+            in_flight.discard(task)
             try:
-                req_start = time.time()
-                response = requests.get(url, timeout=5)
-                elapsed = (time.time() - req_start) * 1000
-                
-                request_count += 1
-                response_times.append(elapsed)
-                
-                if response.status_code < 400:
-                    success_count += 1
-                else:
-                    failure_count += 1
-                    error_count += 1
-            except Exception as e:
-                failure_count += 1
+                elapsed, ok = task.result()
+            except Exception:
+                error_count += 1
+                return
+            response_times.append(elapsed)
+            if ok:
+                success_count += 1
+            else:
                 error_count += 1
         
-        # Create thread pool for concurrent requests
-        with ThreadPoolExecutor(max_workers=concurrent_users) as executor:
-            futures = []
-            
-            # Submit requests at specified rate
-            while time.time() - start_time < duration and not self.stop_event.is_set():
-                # Submit batch of requests
-                for _ in range(rate_per_second):
-                    if time.time() - start_time < duration:
-                        futures.append(executor.submit(make_request))
+        # A target that can't keep up would otherwise pile up one pending task per
+        # scheduled request; past this many, submission waits for one to finish
+        max_in_flight = concurrent_users * 4
+        
+        start_time = time.monotonic()
+        users = asyncio.Semaphore(concurrent_users)
+        connector = aiohttp.TCPConnector(limit=concurrent_users)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Submit requests at specified rate - each one is due a fixed interval after
+            # the last, so submission cost doesn't make the rate drift
+            interval = 1.0 / rate_per_second
+            next_slot = start_time
+            while time.monotonic() - start_time < duration and not self.stop_event.is_set():
+                while len(in_flight) >= max_in_flight:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                
+                task = asyncio.create_task(make_request(session, users))
+                task.add_done_callback(on_done)
+                in_flight.add(task)
+                request_count += 1
                 
-                # Wait 1 second before next batch
-                time.sleep(1)
+                next_slot += interval
+                delay = next_slot - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
             
-            # Wait for all requests to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except:
-                    pass
+            # Wait for the remaining requests to complete
+            if in_flight:
+                await asyncio.wait(in_flight)
         
-        elapsed_total = time.time() - start_time
+        failure_count = request_count - success_count
+        elapsed_total = time.monotonic() - start_time
         
         if response_times:
-            avg_time = sum(response_times) / len(response_times)
+            avg_time = statistics.fmean(response_times)
             min_time = min(response_times)
             max_time = max(response_times)
             throughput = len(response_times) / elapsed_total if elapsed_total > 0 else 0
+            if len(response_times) > 1:
+                cuts = statistics.quantiles(response_times, n=100, method='inclusive')
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = response_times[0]
         else:
             avg_time = min_time = max_time = throughput = 0
+            p50 = p95 = p99 = 0
         
         return LoadTestResult(
             total_requests=request_count,
@@ -211,54 +283,70 @@ class HybridAttackLoadTester:
             min_response_time=min_time,
             max_response_time=max_time,
             throughput=throughput,
-            error_count=error_count
+            error_count=error_count,
+            p50_response_time=p50,
+            p95_response_time=p95,
+            p99_response_time=p99
         )
     
     def run_attack_under_load(self, endpoint: str, parameter: str = "id",
                               load_duration: int = 30, concurrent_users: int = 50) -> List[AttackResult]:
         """Run vulnerability attacks while load/flood is happening"""
         console.print(f"[red]⚔️  Running attacks under load...[/red]")
-        
+        return asyncio.run(self._attack_under_load(endpoint, parameter, load_duration, concurrent_users))
+    
+    async def _attack_under_load(self, endpoint: str, parameter: str,
+                                 load_duration: int, concurrent_users: int) -> List[AttackResult]:
+        """Attacks and background flood share one event loop and one session"""
+        # One connection more than the flood may use, so attacks never queue behind it
+        connector = aiohttp.TCPConnector(limit=concurrent_users + 1)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Start load flood in background
+            flood_task = asyncio.create_task(
+                self._background_flood(session, endpoint, load_duration, concurrent_users)
+            )
+            try:
+                # Give load a moment to start
+                await asyncio.sleep(2)
+                return await self._run_attacks(session, endpoint, parameter, load_duration)
+            finally:
+                flood_task.cancel()
+                await asyncio.gather(flood_task, return_exceptions=True)
+    
+    async def _run_attacks(self, session: aiohttp.ClientSession, endpoint: str,
+                           parameter: str, load_duration: int) -> List[AttackResult]:
+        """Send the SQLi and XSS payloads one at a time"""
         url = f"{self.target_url}{endpoint}"
+        timeout = aiohttp.ClientTimeout(total=5)
         attack_results = []
         
-        # Start load flood in background
-        load_thread = threading.Thread(
-            target=self._run_load_in_background,
-            args=(endpoint, load_duration, concurrent_users),
-            daemon=True
-        )
-        load_thread.start()
-        
-        # Give load a moment to start
-        time.sleep(2)
-        
         # Now run attacks
-        start_time = time.time()
+        start_time = time.perf_counter()
         attack_count = 0
         
         # SQL Injection attacks under load
         if 'sqli' in self.attack_types:
-            for payload in self.sqli_tester.payloads[:10]:  # Test first 10 payloads
-                if time.time() - start_time > load_duration:
+            sqli_payloads = tuple(self.sqli_tester.payloads[:10])  # Test first 10 payloads
+            # Encode payloads once up front - raw '&', '#' or '+' would change what the server sees
+            prepared = [(payload, _url_with_param(url, parameter, payload)) for payload in sqli_payloads]
+            for payload, test_url in prepared:
+                if time.perf_counter() - start_time > load_duration:
                     break
                     
                 try:
-                    attack_start = time.time()
-                    test_url = f"{url}?{parameter}={payload}"
-                    response = requests.get(test_url, timeout=5)
-                    elapsed = (time.time() - attack_start) * 1000
+                    attack_start = time.perf_counter()
+                    async with session.get(test_url, timeout=timeout) as response:
+                        body = await _read_body_head(response)
+                    elapsed = (time.perf_counter() - attack_start) * 1000
                     
                     # Check for SQL errors
-                    content_lower = response.text.lower()
                     found_vuln = False
                     evidence = None
                     
-                    for pattern in self.sqli_tester.error_patterns:
-                        if pattern in content_lower:
-                            found_vuln = True
-                            evidence = f"SQL error pattern: {pattern}"
-                            break
+                    match = self._sqli_error_re.search(body) if self._sqli_error_re else None
+                    if match:
+                        found_vuln = True
+                        evidence = f"SQL error pattern: {match.group(0).decode('utf-8', 'replace').lower()}"
                     
                     attack_results.append(AttackResult(
                         attack_type="SQL Injection",
@@ -272,7 +360,7 @@ class HybridAttackLoadTester:
                     ))
                     
                     attack_count += 1
-                    time.sleep(0.5)  # Small delay between attacks
+                    await asyncio.sleep(0.5)  # Small delay between attacks
                     
                 except Exception as e:
                     attack_results.append(AttackResult(
@@ -287,22 +375,28 @@ class HybridAttackLoadTester:
         
         # XSS attacks under load
         if 'xss' in self.attack_types:
-            for payload in self.xss_tester.payloads[:10]:  # Test first 10 payloads
-                if time.time() - start_time > load_duration:
+            xss_payloads = tuple(self.xss_tester.payloads[:10])  # Test first 10 payloads
+            # Encoded up front like the SQLi URLs; the bytes form is what the reflection check searches for
+            prepared = [(payload, payload.encode('utf-8'), _url_with_param(url, parameter, payload))
+                        for payload in xss_payloads]
+            for payload, payload_bytes, test_url in prepared:
+                if time.perf_counter() - start_time > load_duration:
                     break
                     
                 try:
-                    attack_start = time.time()
-                    test_url = f"{url}?{parameter}={payload}"
-                    response = requests.get(test_url, timeout=5)
-                    elapsed = (time.time() - attack_start) * 1000
+                    attack_start = time.perf_counter()
+                    async with session.get(test_url, timeout=timeout) as response:
+                        body = await _read_body_head(response)
+                    elapsed = (time.perf_counter() - attack_start) * 1000
                     
                     # Check if payload reflected
                     found_vuln = False
                     evidence = None
                     
-                    if payload in response.text or payload.replace('<', '&lt;') not in response.text:
-                        if '<script>' in response.text.lower() or 'onerror=' in response.text.lower():
+                    # Reflected verbatim (not entity-encoded) and carrying active markup
+                    if payload_bytes in body:
+                        body_lower = body.lower()
+                        if b'<script>' in body_lower or b'onerror=' in body_lower:
                             found_vuln = True
                             evidence = "Payload reflected without proper encoding"
                     
@@ -318,7 +412,7 @@ class HybridAttackLoadTester:
                     ))
                     
                     attack_count += 1
-                    time.sleep(0.5)  # Small delay between attacks
+                    await asyncio.sleep(0.5)  # Small delay between attacks
                     
                 except Exception as e:
                     attack_results.append(AttackResult(
@@ -333,28 +427,40 @@ class HybridAttackLoadTester:
         
         return attack_results
     
-    def _run_load_in_background(self, endpoint: str, duration: int, concurrent_users: int):
-        """Run load flood in background thread"""
+    async def _background_flood(self, session: aiohttp.ClientSession, endpoint: str,
+                                duration: int, concurrent_users: int):
+        """Fire a request every 0.1s, at most concurrent_users in flight; results are ignored"""
         url = f"{self.target_url}{endpoint}"
-        start_time = time.time()
+        timeout = aiohttp.ClientTimeout(total=5)
+        start_time = time.perf_counter()
+        users = asyncio.Semaphore(concurrent_users)
         
-        def make_request():
-            try:
-                requests.get(url, timeout=5)
-            except:
-                pass
-        
-        with ThreadPoolExecutor(max_workers=concurrent_users) as executor:
-            futures = []
-            while time.time() - start_time < duration and not self.stop_event.is_set():
-                futures.append(executor.submit(make_request))
-                time.sleep(0.1)  # High rate
-            
-            for future in as_completed(futures):
+        async def make_request():
+            async with users:
                 try:
-                    future.result()
-                except:
+                    async with session.get(url, timeout=timeout):
+                        pass
+                except Exception:
                     pass
+        
+        # Results are ignored, so finished requests just drop out of the set - nothing to drain
+        in_flight = set()
+        try:
+            while time.perf_counter() - start_time < duration and not self.stop_event.is_set():
+                task = asyncio.create_task(make_request())
+                task.add_done_callback(in_flight.discard)
+                in_flight.add(task)
+                await asyncio.sleep(0.1)  # High rate
+            
+            if in_flight:
+                await asyncio.wait(in_flight)
+        finally:
+            # Cancelled once the attacks finish - don't leave requests running
+            pending = list(in_flight)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
     
     def run_hybrid_test(self, endpoint: str, parameter: str = "id",
                        load_duration: int = 30, concurrent_users: int = 50) -> HybridTestResult:
@@ -386,12 +492,26 @@ class HybridAttackLoadTester:
         load_result = self.run_load_flood(endpoint, load_duration, concurrent_users)
         result.load_test_result = load_result
         
-        console.print(f"[green]✅ Load test completed[/green]")
-        console.print(f"   Total requests: {load_result.total_requests}")
-        console.print(f"   Success rate: {(load_result.success_count/load_result.total_requests*100):.1f}%" if load_result.total_requests > 0 else "   Success rate: 0%")
-        console.print(f"   Avg response time: {load_result.avg_response_time:.2f}ms")
-        console.print(f"   Throughput: {load_result.throughput:.2f} req/s")
-        console.print(f"   Errors: {load_result.error_count}")
+        # One table, one print - instead of a console.print per metric
+        success_rate = (load_result.success_count / load_result.total_requests * 100
+                        if load_result.total_requests > 0 else 0)
+        table = Table(
+            title="[green]✅ Load test completed[/green]",
+            title_justify="left",
+            show_header=False,
+            box=None,
+            padding=(0, 1, 0, 3)
+        )
+        table.add_column()
+        table.add_column()
+        table.add_row("Total requests", str(load_result.total_requests))
+        table.add_row("Success rate", f"{success_rate:.1f}%")
+        table.add_row("Avg response time", f"{load_result.avg_response_time:.2f}ms")
+        table.add_row("P50/P95/P99", f"{load_result.p50_response_time:.2f} / "
+                                     f"{load_result.p95_response_time:.2f} / {load_result.p99_response_time:.2f}ms")
+        table.add_row("Throughput", f"{load_result.throughput:.2f} req/s")
+        table.add_row("Errors", str(load_result.error_count))
+        console.print(table)
         
         # Check if system is stressed
         if load_result.avg_response_time > 2000 or load_result.error_count > load_result.total_requests * 0.2:
@@ -433,14 +553,21 @@ class HybridAttackLoadTester:
                         attacks_under_load: List[AttackResult],
                         load_result: LoadTestResult) -> Dict:
         """Compare baseline vs attacks under load"""
+        total_attacks = len(attacks_under_load)
+        successes = 0
+        total_rt = 0.0
+        for attack in attacks_under_load:
+            successes += attack.success
+            total_rt += attack.response_time
+        
         comparison = {
             'baseline_success': baseline.success if baseline else False,
             'baseline_response_time': baseline.response_time if baseline else 0,
-            'total_attacks_under_load': len(attacks_under_load),
-            'successful_attacks_under_load': len([a for a in attacks_under_load if a.success]),
+            'total_attacks_under_load': total_attacks,
+            'successful_attacks_under_load': successes,
             'baseline_success_rate': 100.0 if baseline and baseline.success else 0.0,
-            'under_load_success_rate': (len([a for a in attacks_under_load if a.success]) / len(attacks_under_load) * 100) if attacks_under_load else 0.0,
-            'avg_attack_response_time': sum([a.response_time for a in attacks_under_load]) / len(attacks_under_load) if attacks_under_load else 0,
+            'under_load_success_rate': successes / total_attacks * 100 if total_attacks else 0.0,
+            'avg_attack_response_time': total_rt / total_attacks if total_attacks else 0,
             'load_avg_response_time': load_result.avg_response_time,
             'load_made_attacks_easier': False,
             'system_stressed': load_result.avg_response_time > 2000 or load_result.error_count > load_result.total_requests * 0.2
@@ -463,7 +590,10 @@ class HybridAttackLoadTester:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = RESULTS_DIR / f"hybrid_attack_load_report_{timestamp}.html"
         
-        html_content = f'''<!DOCTYPE html>
+        # Accumulate in a buffer - repeated += on one big string re-copies it every time
+        buf = io.StringIO()
+        w = buf.write
+        w(f'''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -494,24 +624,26 @@ class HybridAttackLoadTester:
         <div class="metric">Successful Exploits Under Load: {sum([len([a for a in r.attacks_under_load if a.success]) for r in results])}</div>
         <div class="metric">Tests Where Load Made Attacks Easier: {sum([1 for r in results if r.comparison.get('load_made_attacks_easier', False)])}</div>
         
-'''
+''')
         
+        # Payloads are live XSS/SQLi strings - escape everything that came from a target or payload list
         for idx, result in enumerate(results, 1):
             comparison = result.comparison
-            html_content += f'''
-        <h2>🎯 Test #{idx}: {result.endpoint}</h2>
+            w(f'''
+        <h2>🎯 Test #{idx}: {_esc(result.endpoint)}</h2>
         <div class="result {'success' if comparison.get('load_made_attacks_easier') else 'warning'}">
-            <h3>Target: {result.target_url}{result.endpoint}</h3>
+            <h3>Target: {_esc(result.target_url + result.endpoint)}</h3>
             
             <h4>📋 Baseline Attack (No Load)</h4>
             <p><strong>Status:</strong> {'✅ Success' if result.baseline_attack and result.baseline_attack.success else '❌ No vulnerabilities found'}</p>
-            {f'<p><strong>Attack Type:</strong> {result.baseline_attack.attack_type}</p>' if result.baseline_attack else ''}
+            {f'<p><strong>Attack Type:</strong> {_esc(result.baseline_attack.attack_type)}</p>' if result.baseline_attack else ''}
             {f'<p><strong>Response Time:</strong> {result.baseline_attack.response_time:.2f}ms</p>' if result.baseline_attack else ''}
             
             <h4>🌊 Load Test Results</h4>
             <div class="metric">Total Requests: {result.load_test_result.total_requests}</div>
             <div class="metric">Success Rate: {(result.load_test_result.success_count/result.load_test_result.total_requests*100):.1f}%</div>
             <div class="metric">Avg Response Time: {result.load_test_result.avg_response_time:.2f}ms</div>
+            <div class="metric">P50/P95/P99: {result.load_test_result.p50_response_time:.2f} / {result.load_test_result.p95_response_time:.2f} / {result.load_test_result.p99_response_time:.2f}ms</div>
             <div class="metric">Throughput: {result.load_test_result.throughput:.2f} req/s</div>
             <div class="metric">Errors: {result.load_test_result.error_count}</div>
             
@@ -532,30 +664,30 @@ class HybridAttackLoadTester:
                     <th>Response Time</th>
                     <th>Severity</th>
                 </tr>
-'''
+''')
             
             for attack in [a for a in result.attacks_under_load if a.success]:
-                html_content += f'''
+                w(f'''
                 <tr>
-                    <td>{attack.attack_type}</td>
-                    <td>{attack.payload[:50]}...</td>
+                    <td>{_esc(attack.attack_type)}</td>
+                    <td>{_esc(attack.payload[:50])}...</td>
                     <td>{attack.response_time:.2f}ms</td>
-                    <td><strong>{attack.severity}</strong></td>
+                    <td><strong>{_esc(attack.severity)}</strong></td>
                 </tr>
-'''
+''')
             
-            html_content += '''
+            w('''
             </table>
         </div>
-'''
+''')
         
-        html_content += '''
+        w('''
     </div>
 </body>
 </html>
-'''
+''')
         
-        report_path.write_text(html_content, encoding='utf-8')
+        report_path.write_text(buf.getvalue(), encoding='utf-8')
         return str(report_path)
 
 
@@ -0,0 +1,14 @@
+
+import os
+
+from locust import FastHttpUser, task, between
+
+ENDPOINT = os.environ.get("PERF_ENDPOINT", "/")
+
+
+class QuickTestUser(FastHttpUser):
+    wait_time = between(1, 2)
+    
+    @task
+    def test_endpoint(self):
+        self.client.get(ENDPOINT, name=ENDPOINT)
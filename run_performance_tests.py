@@ -4,19 +4,20 @@ Unified Performance Testing Runner
 Supports k6, JMeter, and Locust via Docker (Windows compatible)
 """
 
+import json
 import subprocess
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
-
-# Fix Windows encoding
-if sys.platform == "win32":
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+# Fix Windows encoding - reconfigure in place rather than stacking another wrapper
+# (replaced streams such as pytest's capture or io.StringIO have no reconfigure)
+try:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+except AttributeError:
+    pass
 
 SCRIPT_DIR = Path(__file__).parent.absolute()
 K6_DIR = SCRIPT_DIR / "k6"
@@ -25,9 +26,242 @@ LOCUST_DIR = SCRIPT_DIR / "locust"
 RESULTS_DIR = SCRIPT_DIR / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
 
+# Docker volume mounts - SCRIPT_DIR is already absolute, so build these once
+K6_MOUNT = f"{K6_DIR}:/scripts"
+JMETER_MOUNT = f"{JMETER_DIR}:/scripts"
+RESULTS_MOUNT = f"{RESULTS_DIR}:/results"
+
+# CLI test names -> script files; argparse choices are derived from these
+K6_TEST_MAP = {
+    "basic": "basic_api_test.js",
+    "stress": "stress_test.js",
+    "spike": "spike_test.js",
+}
+JMETER_TEST_MAP = {
+    "api": "api_test.jmx",
+}
+
+# Throughput mode: skip the compatibility transform and all threshold/summary bookkeeping
+K6_FAST_FLAGS = ["--compatibility-mode=base", "--no-thresholds", "--no-summary"]
+
+K6_IMAGE = "grafana/k6:latest"
+JMETER_IMAGE = "justb4/jmeter:latest"
+IMAGE_DIGESTS_FILE = RESULTS_DIR / ".image_digests.json"
+# docker run's exit code when docker itself fails (e.g. "No such image"), not the container
+DOCKER_RUN_FAILED = 125
+JMETER_CONTAINER_NAME = "perf-sandbox-jmeter"
+
+# Registry (e.g. ghcr.io/acme) holding the BuildKit cache for locally built tool images.
+# Unset means no registry cache - repeat builds on one machine still reuse local layers.
+IMAGE_CACHE_REGISTRY = os.environ.get("PERF_IMAGE_CACHE_REGISTRY", "").rstrip("/")
+
+_digests_lock = threading.Lock()
+_console = None
 
-def run_k6_test(test_script: str, base_url: str, output_file: str = None):
-    """Run k6 performance test via Docker"""
+
+def _get_console():
+    """Create the Rich console on first use, so importing this module doesn't pay for rich"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        # Status lines carry their own markup; skip the repr highlighter's regex pass
+        _console = Console(highlight=False)
+    return _console
+
+
+def _stream_command(cmd: list, prefix: str = "", env: dict = None):
+    """Run cmd, passing its output straight through as it arrives (like check=True on failure)
+    
+    Output stays as bytes end to end - tool logs are never decoded and re-encoded.
+    prefix tags each line so concurrent runs (the `all` command) stay readable.
+    """
+    out = sys.stdout.buffer
+    # Anything Rich printed must land before the tool's own bytes
+    sys.stdout.flush()
+    
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env) as proc:
+        if prefix:
+            tag = prefix.encode("utf-8")
+            for line in proc.stdout:
+                out.write(tag + line)
+                out.flush()
+        else:
+            # read1 returns whatever is buffered rather than waiting for a full chunk
+            for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+                out.write(chunk)
+                out.flush()
+    
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def refresh_image_digests() -> dict:
+    """Record the digest of every local image in one docker call and cache it on disk"""
+    result = subprocess.run(
+        ["docker", "images", "--digests", "--format", "{{.Repository}}:{{.Tag}} {{.Repository}}@{{.Digest}}"],
+        capture_output=True,
+        text=True,
+        timeout=10
+    )
+    digests = {}
+    for line in result.stdout.splitlines():
+        image, _, pinned = line.partition(" ")
+        if pinned and not pinned.endswith("@<none>"):
+            digests[image] = pinned
+    IMAGE_DIGESTS_FILE.write_text(json.dumps(digests, indent=2), encoding="utf-8")
+    return digests
+
+
+def update_images():
+    """Pull the latest tool images and refresh the digest cache"""
+    console = _get_console()
+    try:
+        for image in (K6_IMAGE, JMETER_IMAGE):
+            console.print(f"[dim]Pulling {image}...[/dim]")
+            subprocess.run(["docker", "pull", image], check=False)
+        refresh_image_digests()
+        return True
+    except FileNotFoundError:
+        console.print("[bold red]❌ Docker not found. Please install Docker Desktop.[/bold red]")
+        return False
+    except subprocess.SubprocessError as e:
+        console.print(f"[bold red]❌ Could not update images: {e}[/bold red]")
+        return False
+
+
+def _pinned_image(image: str) -> tuple:
+    """Return (image reference, extra docker run args) for image
+    
+    Images pinned by --update-images run by digest with --pull=never, so the daemon
+    never goes looking for a newer :latest. Reading the cache costs no docker call;
+    anything not in it runs by plain tag with docker's default --pull=missing.
+    """
+    with _digests_lock:
+        try:
+            digests = json.loads(IMAGE_DIGESTS_FILE.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            digests = {}
+    
+    if image in digests:
+        return digests[image], ["--pull=never"]
+    return image, []
+
+
+def _forget_pin(image: str):
+    """Drop image from the digest cache once its pinned digest is gone"""
+    with _digests_lock:
+        try:
+            digests = json.loads(IMAGE_DIGESTS_FILE.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return
+        if digests.pop(image, None) is not None:
+            IMAGE_DIGESTS_FILE.write_text(json.dumps(digests, indent=2), encoding="utf-8")
+
+
+def _run_pinned(image: str, run):
+    """Call run(image_ref, pull_args) with the pinned image, retrying by tag if the pin is stale
+    
+    After `docker image prune`/`rmi` the pinned digest no longer exists locally and
+    --pull=never makes docker itself fail (exit 125, which k6 and JMeter never use).
+    """
+    ref, pull_args = _pinned_image(image)
+    try:
+        return run(ref, pull_args)
+    except subprocess.CalledProcessError as e:
+        if not pull_args or e.returncode != DOCKER_RUN_FAILED:
+            raise
+    
+    _forget_pin(image)
+    _get_console().print(f"[yellow]⚠️  Pinned {ref} is no longer available; running {image} instead[/yellow]")
+    return run(image, [])
+
+
+def build_tool_image(tool_dir: Path, stock_image: str) -> str:
+    """Build the tool's wrapper image if its directory has a Dockerfile, else use the stock image
+    
+    Teams drop a Dockerfile into k6/ or jmeter/ for extensions and plugins. It is built
+    on every run so changes anywhere in the build context are picked up; BuildKit's
+    layer cache makes an unchanged rebuild nearly free. With PERF_IMAGE_CACHE_REGISTRY
+    set, layers are also shared through <registry>/<tag>-cache so fresh CI daemons
+    don't rebuild from scratch.
+    """
+    if not (tool_dir / "Dockerfile").exists():
+        return stock_image
+    
+    console = _get_console()
+    tag = f"performance-sandbox-{tool_dir.name}:local"
+    console.print(f"[dim]Building {tag} from {tool_dir.name}/Dockerfile...[/dim]")
+    
+    cmd = ["docker", "buildx", "build", "--load", "--tag", tag]
+    build_env = {**os.environ, "DOCKER_BUILDKIT": "1"}
+    try:
+        if IMAGE_CACHE_REGISTRY:
+            cache_ref = f"{IMAGE_CACHE_REGISTRY}/{tag}-cache"
+            cache_args = [f"--cache-from=type=registry,ref={cache_ref}", f"--cache-to=type=registry,ref={cache_ref},mode=max"]
+            try:
+                subprocess.run([*cmd, *cache_args, str(tool_dir)], check=True, env=build_env)
+                return tag
+            except subprocess.CalledProcessError:
+                # The default `docker` buildx driver can't export a registry cache
+                console.print(
+                    f"[yellow]⚠️  Build with registry cache {cache_ref} failed - it needs a docker-container "
+                    f"builder (docker buildx create --use). Retrying without the cache...[/yellow]"
+                )
+        
+        subprocess.run([*cmd, str(tool_dir)], check=True, env=build_env)
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        console.print(f"[yellow]⚠️  Could not build {tag} ({e}); using {stock_image}[/yellow]")
+        return stock_image
+    
+    return tag
+
+
+def _get_or_start_jmeter_container(image: str, pull_args: list, mounts: list) -> str:
+    """Return the long-lived JMeter container, starting it if it isn't running"""
+    result = subprocess.run(
+        ["docker", "inspect", "-f", "{{.State.Running}}", JMETER_CONTAINER_NAME],
+        capture_output=True,
+        text=True
+    )
+    if result.returncode == 0 and result.stdout.strip() == "true":
+        return JMETER_CONTAINER_NAME
+    
+    # Clear out a stopped leftover before starting a fresh idle container
+    subprocess.run(["docker", "rm", "-f", JMETER_CONTAINER_NAME], capture_output=True)
+    subprocess.run(
+        [
+            "docker", "run", "-d", "--rm", *pull_args,
+            "--name", JMETER_CONTAINER_NAME,
+            *mounts,
+            "--entrypoint", "tail",
+            image,
+            "-f", "/dev/null"
+        ],
+        check=True,
+        # Only the container ID goes to stdout; leave stderr visible so a failed start explains itself
+        stdout=subprocess.DEVNULL
+    )
+    return JMETER_CONTAINER_NAME
+
+
+def cleanup_containers():
+    """Stop the persistent JMeter container left by --keep-container"""
+    console = _get_console()
+    result = subprocess.run(["docker", "rm", "-f", JMETER_CONTAINER_NAME], capture_output=True, text=True)
+    if result.returncode == 0:
+        console.print(f"[green]✅ Removed {JMETER_CONTAINER_NAME}[/green]")
+    else:
+        console.print(f"[dim]No {JMETER_CONTAINER_NAME} container running[/dim]")
+
+
+def run_k6_test(test_script: str, base_url: str, output_file: str = None, prefix: str = "",
+                fast: bool = False):
+    """Run k6 performance test via Docker
+    
+    fast adds K6_FAST_FLAGS for pure throughput runs - thresholds aren't evaluated and
+    no end-of-test summary (or handleSummary output) is produced.
+    """
+    console = _get_console()
     console.print(
         f"[bold cyan]🚀 Running k6 Test[/bold cyan]\n"
         f"[dim]Script: {test_script}[/dim]\n"
@@ -35,34 +269,38 @@ def run_k6_test(test_script: str, base_url: str, output_file: str = None):
     )
     
     try:
-        # Convert Windows path to Docker-compatible path
-        volume_mount = f"{K6_DIR.absolute()}:/scripts"
-        
-        cmd = [
-            "docker", "run", "--rm", "-i",
-            "-v", volume_mount,
-            "-e", f"BASE_URL={base_url}",
-            "grafana/k6:latest",
-            "run", f"/scripts/{test_script}"
-        ]
+        def run(image, pull_args):
+            _stream_command([
+                "docker", "run", "--rm", "-i", *pull_args,
+                "-v", K6_MOUNT,
+                "-e", f"BASE_URL={base_url}",
+                image,
+                "run", *(K6_FAST_FLAGS if fast else []), f"/scripts/{test_script}"
+            ], prefix)
         
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        _run_pinned(build_tool_image(K6_DIR, K6_IMAGE), run)
         
         console.print("[bold green]✅ k6 test completed successfully[/bold green]")
-        console.print(result.stdout)
         
         return True
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]❌ k6 test failed: {e}[/bold red]")
-        console.print(e.stderr)
         return False
     except FileNotFoundError:
         console.print("[bold red]❌ Docker not found. Please install Docker Desktop.[/bold red]")
         return False
 
 
-def run_jmeter_test(test_plan: str, base_url: str):
-    """Run JMeter performance test via Docker"""
+def run_jmeter_test(test_plan: str, base_url: str, prefix: str = "", keep_container: bool = False,
+                    html_report: bool = True):
+    """Run JMeter performance test via Docker
+    
+    With keep_container, the plan runs via docker exec in a container that outlives this
+    call, so repeated runs skip container creation (`cleanup` removes it).
+    Without html_report only the CSV .jtl is written - JMeter skips re-reading it to
+    render the dashboard.
+    """
+    console = _get_console()
     console.print(
         f"[bold yellow]🔧 Running JMeter Test[/bold yellow]\n"
         f"[dim]Test Plan: {test_plan}[/dim]\n"
@@ -70,37 +308,56 @@ def run_jmeter_test(test_plan: str, base_url: str):
     )
     
     try:
-        volume_mount = f"{JMETER_DIR.absolute()}:/scripts"
-        results_mount = f"{RESULTS_DIR.absolute()}:/results"
-        
-        cmd = [
-            "docker", "run", "--rm", "-i",
-            "-v", volume_mount,
-            "-v", results_mount,
-            "-e", f"BASE_URL={base_url}",
-            "justb4/jmeter:latest",
+        mounts = ["-v", JMETER_MOUNT, "-v", RESULTS_MOUNT]
+        jmeter_args = [
             "-n", "-t", f"/scripts/{test_plan}",
             "-l", "/results/jmeter_results.jtl",
-            "-e", "-o", "/results/jmeter_html_report"
+            "-Jjmeter.save.saveservice.output_format=csv"
         ]
+        if html_report:
+            jmeter_args += ["-e", "-o", "/results/jmeter_html_report"]
         
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        def run(image, pull_args):
+            if keep_container:
+                container = _get_or_start_jmeter_container(image, pull_args, mounts)
+                cmd = ["docker", "exec", "-e", f"BASE_URL={base_url}", container, "jmeter", *jmeter_args]
+            else:
+                cmd = [
+                    "docker", "run", "--rm", "-i", *pull_args,
+                    *mounts,
+                    "-e", f"BASE_URL={base_url}",
+                    image,
+                    *jmeter_args
+                ]
+            _stream_command(cmd, prefix)
+        
+        _run_pinned(build_tool_image(JMETER_DIR, JMETER_IMAGE), run)
         
         console.print("[bold green]✅ JMeter test completed successfully[/bold green]")
-        console.print(f"[cyan]📊 HTML report available at: {RESULTS_DIR / 'jmeter_html_report' / 'index.html'}[/cyan]")
+        if html_report:
+            console.print(f"[cyan]📊 HTML report available at: {RESULTS_DIR / 'jmeter_html_report' / 'index.html'}[/cyan]")
+        else:
+            console.print(f"[cyan]📊 Results written to: {RESULTS_DIR / 'jmeter_results.jtl'}[/cyan]")
         
         return True
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]❌ JMeter test failed: {e}[/bold red]")
-        console.print(e.stderr)
         return False
     except FileNotFoundError:
         console.print("[bold red]❌ Docker not found. Please install Docker Desktop.[/bold red]")
         return False
 
 
-def run_locust_test(base_url: str, users: int = 10, spawn_rate: float = 2, run_time: str = "60s"):
-    """Run Locust performance test (native Python, no Docker needed)"""
+def run_locust_test(base_url: str, users: int = 10, spawn_rate: float = 2, run_time: str = "60s",
+                    prefix: str = "", processes: int = None, stats_interval: float = 10,
+                    csv_full_history: bool = False):
+    """Run Locust performance test (native Python, no Docker needed)
+    
+    processes forks that many Locust workers (-1 = one per CPU core) so load generation
+    isn't capped at a single core. Locust only supports this on POSIX.
+    stats_interval sets how often (seconds) the CSV stats files are rewritten.
+    """
+    console = _get_console()
     console.print(
         f"[bold green]🦗 Running Locust Test[/bold green]\n"
         f"[dim]Target: {base_url}[/dim]\n"
@@ -126,7 +383,19 @@ def run_locust_test(base_url: str, users: int = 10, spawn_rate: float = 2, run_t
             "--csv", str(RESULTS_DIR / "locust_results")
         ]
         
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        if processes is not None:
+            if sys.platform == "win32":
+                console.print("[yellow]⚠️  --processes is not supported on Windows; running one process[/yellow]")
+            else:
+                cmd += ["--processes", str(processes)]
+        
+        if csv_full_history:
+            cmd.append("--csv-full-history")
+        
+        # Picked up by locustfile.py - Locust itself has no flag for the CSV write interval
+        env = {**os.environ, "PERF_CSV_STATS_INTERVAL": str(stats_interval)}
+        
+        _stream_command(cmd, prefix, env)
         
         console.print("[bold green]✅ Locust test completed successfully[/bold green]")
         console.print(f"[cyan]📊 HTML report available at: {RESULTS_DIR / 'locust_report.html'}[/cyan]")
@@ -134,36 +403,60 @@ def run_locust_test(base_url: str, users: int = 10, spawn_rate: float = 2, run_t
         return True
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]❌ Locust test failed: {e}[/bold red]")
-        console.print(e.stderr)
         return False
     except FileNotFoundError:
         console.print("[bold red]❌ Locust not installed. Run: pip install locust[/bold red]")
         return False
 
 
+def run_all_tests(base_url: str, k6_script: str, jmeter_plan: str,
+                  users: int = 10, spawn_rate: float = 2, run_time: str = "60s",
+                  keep_container: bool = False, processes: int = None, html_report: bool = True,
+                  stats_interval: float = 10, csv_full_history: bool = False):
+    """Run k6, JMeter and Locust against the same target at once"""
+    console = _get_console()
+    # Each tool mostly waits on Docker or the network, so threads overlap them fully
+    jobs = {
+        "k6": (run_k6_test, (k6_script, base_url), {"prefix": "[k6] "}),
+        "JMeter": (run_jmeter_test, (jmeter_plan, base_url), {"prefix": "[jmeter] ", "keep_container": keep_container, "html_report": html_report}),
+        "Locust": (run_locust_test, (base_url, users, spawn_rate, run_time),
+                   {"prefix": "[locust] ", "processes": processes, "stats_interval": stats_interval,
+                    "csv_full_history": csv_full_history}),
+    }
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {executor.submit(func, *args, **kwargs): tool for tool, (func, args, kwargs) in jobs.items()}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    from rich.table import Table
+    table = Table(title="Run Summary")
+    table.add_column("Tool", style="cyan")
+    table.add_column("Result")
+    for tool in jobs:
+        table.add_row(tool, "[green]✅ Passed[/green]" if results[tool] else "[red]❌ Failed[/red]")
+    console.print(table)
+    
+    return all(results.values())
+
+
 def list_available_tests():
     """List all available performance tests"""
+    console = _get_console()
     console.print("\n[bold]📋 Available Performance Tests[/bold]\n")
     
+    from rich.table import Table
     table = Table(title="Performance Tests")
     table.add_column("Tool", style="cyan")
     table.add_column("Test Name", style="green")
     table.add_column("Script File", style="yellow")
     
-    # k6 tests
-    k6_tests = [
-        ("Basic API Test", "basic_api_test.js"),
-        ("Stress Test", "stress_test.js"),
-        ("Spike Test", "spike_test.js"),
-    ]
-    for name, script in k6_tests:
+    # Rows come from the same maps the CLI dispatches on; the name is what you pass on the command line
+    for name, script in K6_TEST_MAP.items():
         table.add_row("k6", name, script)
     
-    # JMeter tests
-    jmeter_tests = [
-        ("API Test", "api_test.jmx"),
-    ]
-    for name, script in jmeter_tests:
+    for name, script in JMETER_TEST_MAP.items():
         table.add_row("JMeter", name, script)
     
     # Locust tests
@@ -177,6 +470,8 @@ def list_available_tests():
     console.print("  python run_performance_tests.py jmeter api http://localhost:3000\n")
     console.print("  # Run Locust test")
     console.print("  python run_performance_tests.py locust http://localhost:3000 --users 50\n")
+    console.print("  # Run k6, JMeter and Locust at once")
+    console.print("  python run_performance_tests.py all http://localhost:3000\n")
 
 
 def main():
@@ -196,22 +491,44 @@ Examples:
   # Run Locust test
   python run_performance_tests.py locust http://localhost:3000 --users 50
   
+  # Run k6, JMeter and Locust at once
+  python run_performance_tests.py all http://localhost:3000
+  
+  # Reuse one JMeter container across runs, then remove it
+  python run_performance_tests.py jmeter api http://localhost:3000 --keep-container
+  python run_performance_tests.py cleanup
+  
+  # Pull fresh k6/JMeter images before running
+  python run_performance_tests.py --update-images k6 basic http://localhost:3000
+  
   # List all available tests
   python run_performance_tests.py list
         """
     )
     
+    parser.add_argument("--update-images", action="store_true",
+                        help="Pull the latest k6/JMeter images and refresh the cached digests first")
+    
     subparsers = parser.add_subparsers(dest="tool", help="Performance testing tool")
     
+    # The JMeter dashboard is for people; piped/CI runs usually only need the .jtl
+    interactive = sys.stdout.isatty()
+    
     # k6 subcommand
     k6_parser = subparsers.add_parser("k6", help="Run k6 test")
-    k6_parser.add_argument("test", choices=["basic", "stress", "spike"], help="Test type")
+    k6_parser.add_argument("test", choices=list(K6_TEST_MAP), help="Test type")
     k6_parser.add_argument("url", help="Target URL")
+    k6_parser.add_argument("--fast", action="store_true",
+                           help="Throughput mode: --compatibility-mode=base, no thresholds, no summary")
     
     # JMeter subcommand
     jmeter_parser = subparsers.add_parser("jmeter", help="Run JMeter test")
-    jmeter_parser.add_argument("test", choices=["api"], help="Test type")
+    jmeter_parser.add_argument("test", choices=list(JMETER_TEST_MAP), help="Test type")
     jmeter_parser.add_argument("url", help="Target URL")
+    jmeter_parser.add_argument("--keep-container", action="store_true",
+                               help="Run inside a persistent container reused across runs")
+    jmeter_parser.add_argument("--html-report", action=argparse.BooleanOptionalAction, default=interactive,
+                               help="Render JMeter's HTML dashboard (default: on in a terminal, off in CI)")
     
     # Locust subcommand
     locust_parser = subparsers.add_parser("locust", help="Run Locust test")
@@ -219,30 +536,55 @@ Examples:
     locust_parser.add_argument("--users", type=int, default=10, help="Number of users")
     locust_parser.add_argument("--spawn-rate", type=float, default=2, help="Users per second")
     locust_parser.add_argument("--run-time", default="60s", help="Test duration")
+    locust_parser.add_argument("--processes", type=int, help="Worker processes to fork (-1 = one per CPU core, POSIX only)")
+    locust_parser.add_argument("--stats-interval", type=float, default=10, help="Seconds between CSV stats writes")
+    locust_parser.add_argument("--csv-full-history", action="store_true", help="Also write the full stats history CSV")
+    
+    # All subcommand
+    all_parser = subparsers.add_parser("all", help="Run k6, JMeter and Locust concurrently")
+    all_parser.add_argument("url", help="Target URL")
+    all_parser.add_argument("--k6-test", choices=list(K6_TEST_MAP), default="basic", help="k6 test type")
+    all_parser.add_argument("--jmeter-test", choices=list(JMETER_TEST_MAP), default="api", help="JMeter test type")
+    all_parser.add_argument("--users", type=int, default=10, help="Number of Locust users")
+    all_parser.add_argument("--spawn-rate", type=float, default=2, help="Locust users per second")
+    all_parser.add_argument("--run-time", default="60s", help="Locust test duration")
+    all_parser.add_argument("--processes", type=int, help="Locust worker processes (-1 = one per CPU core, POSIX only)")
+    all_parser.add_argument("--stats-interval", type=float, default=10, help="Seconds between Locust CSV stats writes")
+    all_parser.add_argument("--csv-full-history", action="store_true", help="Also write Locust's full stats history CSV")
+    all_parser.add_argument("--keep-container", action="store_true",
+                            help="Run JMeter inside a persistent container reused across runs")
+    all_parser.add_argument("--html-report", action=argparse.BooleanOptionalAction, default=interactive,
+                            help="Render JMeter's HTML dashboard (default: on in a terminal, off in CI)")
+    
+    # Cleanup subcommand
+    subparsers.add_parser("cleanup", help="Remove the persistent JMeter container")
     
     # List subcommand
     list_parser = subparsers.add_parser("list", help="List all available tests")
     
     args = parser.parse_args()
     
+    if args.update_images:
+        update_images()
+    
     if args.tool == "k6":
-        test_map = {
-            "basic": "basic_api_test.js",
-            "stress": "stress_test.js",
-            "spike": "spike_test.js",
-        }
-        script = K6_DIR / test_map[args.test]
-        run_k6_test(script.name, args.url)
+        run_k6_test(K6_TEST_MAP[args.test], args.url, fast=args.fast)
     
     elif args.tool == "jmeter":
-        test_map = {
-            "api": "api_test.jmx",
-        }
-        script = JMETER_DIR / test_map[args.test]
-        run_jmeter_test(script.name, args.url)
+        run_jmeter_test(JMETER_TEST_MAP[args.test], args.url, keep_container=args.keep_container,
+                        html_report=args.html_report)
     
     elif args.tool == "locust":
-        run_locust_test(args.url, args.users, args.spawn_rate, args.run_time)
+        run_locust_test(args.url, args.users, args.spawn_rate, args.run_time, processes=args.processes,
+                        stats_interval=args.stats_interval, csv_full_history=args.csv_full_history)
+    
+    elif args.tool == "all":
+        run_all_tests(args.url, K6_TEST_MAP[args.k6_test], JMETER_TEST_MAP[args.jmeter_test],
+                      args.users, args.spawn_rate, args.run_time, args.keep_container, args.processes,
+                      args.html_report, args.stats_interval, args.csv_full_history)
+    
+    elif args.tool == "cleanup":
+        cleanup_containers()
     
     elif args.tool == "list" or not args.tool:
         list_available_tests()
@@ -4,102 +4,174 @@ Quick verification script for performance testing setup
 Checks Docker, Python packages, and directory structure
 """
 
-import subprocess
+import asyncio
+import importlib.util
+import io
 import sys
 import os
+from importlib.metadata import distributions
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
+from rich.text import Text
 
-# Fix Windows encoding
-if sys.platform == "win32":
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+# Fix Windows encoding - reconfigure in place rather than stacking another wrapper
+# (replaced streams such as pytest's capture or io.StringIO have no reconfigure)
+try:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+except AttributeError:
+    pass
 
-console = Console()
+# Status lines carry their own markup; skip the repr highlighter's regex pass
+console = Console(highlight=False)
 
 SCRIPT_DIR = Path(__file__).parent.absolute()
 
 
-def check_docker():
-    """Check if Docker is available"""
-    console.print("[cyan]🐳 Checking Docker...[/cyan]")
+async def _run_docker(*args, timeout: float = 5):
+    """Run a docker CLI command, returning (returncode, stdout)"""
+    proc = await asyncio.create_subprocess_exec(
+        "docker", *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL
+    )
     try:
-        result = subprocess.run(
-            ["docker", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            console.print(f"[green]✅ Docker found: {result.stdout.strip()}[/green]")
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode("utf-8", errors="replace")
+
+
+async def _pull(image: str) -> bool:
+    """docker pull one image, reporting the outcome as soon as it finishes"""
+    returncode, _ = await _run_docker("pull", image, timeout=None)
+    if returncode == 0:
+        console.print(f"[green]   ✅ {image} pulled[/green]")
+    else:
+        console.print(f"[red]   ❌ Failed to pull {image}[/red]")
+    return returncode == 0
+
+
+async def prepull_images(images: list):
+    """Pull images concurrently - the daemon downloads them side by side"""
+    console.print(f"\n[cyan]🐳 Pulling {', '.join(images)}...[/cyan]")
+    await asyncio.gather(*(_pull(image) for image in images))
+
+
+async def check_docker(out: Console = console, missing: list = None):
+    """Check if Docker is available
+    
+    Missing tool images are appended to `missing` when given (for prepull_images),
+    otherwise reported with a docker pull hint.
+    """
+    out.print("[cyan]🐳 Checking Docker...[/cyan]")
+    try:
+        returncode, version = await _run_docker("--version")
+        if returncode == 0:
+            out.print(f"[green]✅ Docker found: {version.strip()}[/green]")
             
             # Check if Docker images are available
-            console.print("[cyan]   Checking Docker images...[/cyan]")
+            out.print("[cyan]   Checking Docker images...[/cyan]")
             images = ["grafana/k6:latest", "justb4/jmeter:latest"]
+            # One listing for all images instead of a docker round-trip per image
+            _, listing = await _run_docker("images", "--format", "{{.Repository}}:{{.Tag}}")
+            local_images = set(listing.split())
             for image in images:
-                result = subprocess.run(
-                    ["docker", "images", "-q", image],
-                    capture_output=True,
-                    text=True
-                )
-                if result.stdout.strip():
-                    console.print(f"[green]   ✅ {image} available[/green]")
+                if image in local_images:
+                    out.print(f"[green]   ✅ {image} available[/green]")
+                elif missing is not None:
+                    out.print(f"[yellow]   ⚠️  {image} not found - will pull[/yellow]")
+                    missing.append(image)
                 else:
-                    console.print(f"[yellow]   ⚠️  {image} not found. Run: docker pull {image}[/yellow]")
+                    out.print(f"[yellow]   ⚠️  {image} not found. Run: docker pull {image}[/yellow]")
             
             return True
         else:
-            console.print("[red]❌ Docker not working properly[/red]")
+            out.print("[red]❌ Docker not working properly[/red]")
             return False
     except FileNotFoundError:
-        console.print("[red]❌ Docker not found. Please install Docker Desktop.[/red]")
+        out.print("[red]❌ Docker not found. Please install Docker Desktop.[/red]")
+        return False
+    except asyncio.TimeoutError:
+        out.print("[red]❌ Error checking Docker: timed out[/red]")
         return False
     except Exception as e:
-        console.print(f"[red]❌ Error checking Docker: {e}[/red]")
+        out.print(f"[red]❌ Error checking Docker: {e}[/red]")
+        return False
+
+
+def _importable(package: str) -> bool:
+    """Whether package resolves to a real module, found without running any of its code
+    
+    Covers packages with no dist-info metadata (e.g. on PYTHONPATH). The repo's own
+    locust/ folder resolves as a namespace package with no origin, so it doesn't count.
+    """
+    try:
+        spec = importlib.util.find_spec(package.replace("-", "_"))
+    except (ImportError, ValueError):
         return False
+    return spec is not None and spec.origin is not None
 
 
-def check_python_packages():
+def check_python_packages(out: Console = console):
     """Check if required Python packages are installed"""
-    console.print("\n[cyan]🐍 Checking Python packages...[/cyan]")
+    out.print("\n[cyan]🐍 Checking Python packages...[/cyan]")
     
     packages = ["locust", "rich"]
     all_installed = True
     
+    # Read installed distribution metadata instead of importing each package
+    # (importing locust alone pulls in gevent and monkey-patches the process)
+    installed = {
+        dist.metadata["Name"].lower().replace("_", "-")
+        for dist in distributions()
+        if dist.metadata["Name"]
+    }
+    
     for package in packages:
-        try:
-            __import__(package.replace("-", "_"))
-            console.print(f"[green]✅ {package} installed[/green]")
-        except ImportError:
-            console.print(f"[red]❌ {package} not installed. Run: pip install {package}[/red]")
+        if package.lower() in installed or _importable(package):
+            out.print(f"[green]✅ {package} installed[/green]")
+        else:
+            out.print(f"[red]❌ {package} not installed. Run: pip install {package}[/red]")
             all_installed = False
     
     return all_installed
 
 
-def check_directory_structure():
+def _scan(path: Path) -> dict:
+    """Map entry names to DirEntry objects with one directory read (empty if missing)"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def check_directory_structure(out: Console = console):
     """Check if required directories exist"""
-    console.print("\n[cyan]📁 Checking directory structure...[/cyan]")
+    out.print("\n[cyan]📁 Checking directory structure...[/cyan]")
     
     dirs = ["k6", "jmeter", "locust", "results"]
     all_exist = True
+    entries = _scan(SCRIPT_DIR)
     
     for dir_name in dirs:
         dir_path = SCRIPT_DIR / dir_name
-        if dir_path.exists() and dir_path.is_dir():
-            console.print(f"[green]✅ {dir_name}/ directory exists[/green]")
+        if dir_name in entries and entries[dir_name].is_dir():
+            out.print(f"[green]✅ {dir_name}/ directory exists[/green]")
         else:
-            console.print(f"[yellow]⚠️  {dir_name}/ directory not found. Creating...[/yellow]")
+            out.print(f"[yellow]⚠️  {dir_name}/ directory not found. Creating...[/yellow]")
             dir_path.mkdir(exist_ok=True)
             all_exist = False
     
     return all_exist
 
 
-def check_test_files():
+def check_test_files(out: Console = console):
     """Check if test files exist"""
-    console.print("\n[cyan]📄 Checking test files...[/cyan]")
+    out.print("\n[cyan]📄 Checking test files...[/cyan]")
     
     test_files = [
         ("k6/basic_api_test.js", "k6 basic test"),
@@ -110,29 +182,69 @@ def check_test_files():
     ]
     
     all_exist = True
+    listings = {}
     for file_path, description in test_files:
-        full_path = SCRIPT_DIR / file_path
-        if full_path.exists():
-            console.print(f"[green]✅ {description} found[/green]")
+        dir_name, file_name = file_path.split("/")
+        if dir_name not in listings:
+            listings[dir_name] = _scan(SCRIPT_DIR / dir_name)
+        if file_name in listings[dir_name]:
+            out.print(f"[green]✅ {description} found[/green]")
         else:
-            console.print(f"[yellow]⚠️  {description} not found at {file_path}[/yellow]")
+            out.print(f"[yellow]⚠️  {description} not found at {file_path}[/yellow]")
             all_exist = False
     
     return all_exist
 
 
+def _buffered_console() -> Console:
+    """A console that renders like the real one but into memory"""
+    return Console(
+        file=io.StringIO(),
+        highlight=False,
+        force_terminal=console.is_terminal,
+        color_system=console.color_system,
+        width=console.width
+    )
+
+
+async def run_checks(prepull: bool = False) -> dict:
+    """Run all checks concurrently, then print their output in the usual order"""
+    names = ["Docker", "Python Packages", "Directory Structure", "Test Files"]
+    outs = [_buffered_console() for _ in names]
+    missing = [] if prepull else None
+    
+    # Each check writes to its own buffer so concurrent output doesn't interleave
+    passed = await asyncio.gather(
+        check_docker(outs[0], missing),
+        asyncio.to_thread(check_python_packages, outs[1]),
+        asyncio.to_thread(check_directory_structure, outs[2]),
+        asyncio.to_thread(check_test_files, outs[3]),
+    )
+    
+    for out in outs:
+        console.print(Text.from_ansi(out.file.getvalue()), end="")
+    
+    # Pulls can take minutes, so they run after the replay and report live
+    if missing:
+        await prepull_images(missing)
+    
+    return dict(zip(names, passed))
+
+
 def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Verify the performance testing setup")
+    parser.add_argument("--prepull", action="store_true",
+                        help="Pull missing k6/JMeter images (in parallel) instead of just warning")
+    args = parser.parse_args()
+    
     console.print(Panel.fit(
         "[bold cyan]🔍 Performance Testing Setup Verification[/bold cyan]",
         border_style="cyan"
     ))
     
-    results = {
-        "Docker": check_docker(),
-        "Python Packages": check_python_packages(),
-        "Directory Structure": check_directory_structure(),
-        "Test Files": check_test_files(),
-    }
+    results = asyncio.run(run_checks(args.prepull))
     
     console.print("\n[bold]📊 Summary:[/bold]\n")
     